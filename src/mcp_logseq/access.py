@@ -151,7 +151,9 @@ def enforce_page_tag_access(api, page_name: str) -> None:
     # No try/except by design: when exclude tags are configured, a fetch error
     # must abort the write rather than fail open. A non-existent page returns
     # None and falls through as not-excluded.
-    result = api.get_page_content(page_name)
+    # fresh=True: a tag added in Logseq moments ago must still block the
+    # write, so this check never reads from the client's page cache.
+    result = api.get_page_content(page_name, fresh=True)
     if result and is_page_excluded(result.get("page", {}), acl.exclude_tags):
         raise AccessDenied(
             f"Access denied: page '{page_name}' is restricted "
@@ -217,6 +219,18 @@ class NamespaceName(AccessPolicy):
             enforce_namespace_access(name)
 
 
+@dataclass(frozen=True)
+class NamespaceNames(AccessPolicy):
+    """Name-based namespace gate on every page name in the list ``args[arg]``."""
+
+    arg: str
+
+    def enforce(self, api, args: dict) -> None:
+        for name in args.get(self.arg) or []:
+            if name:
+                enforce_namespace_access(name)
+
+
 @dataclass(frozen=True)
 class PageTag(AccessPolicy):
     """Tag-exclusion gate on the EXISTING page named by ``args[arg]``."""
@@ -1,9 +1,105 @@
 import requests
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: pip install "mcp-logseq[fast]"
+    orjson = None
+
 logger = logging.getLogger("mcp-logseq")
 
+# API methods that mutate the graph. Any call to one of these drops the read
+# cache, since a block edit can change page properties (and so tags) too.
+_WRITE_METHODS = frozenset(
+    {
+        "logseq.Editor.createPage",
+        "logseq.Editor.deletePage",
+        "logseq.Editor.renamePage",
+        "logseq.Editor.setPageProperties",
+        "logseq.Editor.appendBlockInPage",
+        "logseq.Editor.insertBatchBlock",
+        "logseq.Editor.insertBlock",
+        "logseq.Editor.updateBlock",
+        "logseq.Editor.removeBlock",
+        "logseq.Editor.upsertBlockProperty",
+        "logseq.Editor.removeBlockProperty",
+    }
+)
+
+
+# Every API call is a POST, so urllib3 cannot tell reads from writes and its
+# status/read retries would replay writes (duplicate pages, double appends).
+# The adapter therefore only retries connection failures, where the request
+# never reached Logseq; _post retries transient gateway statuses and dropped
+# connections (e.g. a pooled socket Logseq closed while idle) itself, and
+# only for read methods.
+_CONNECT_RETRY = Retry(
+    total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.2
+)
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_READ_RETRIES = 2
+_RETRY_BACKOFF = 0.2
+
+# Methods whose responses scale with graph or page size. They get the
+# client's (longer) bulk timeout so a large answer over a slow link is not
+# cut off and re-requested.
+_BULK_METHODS = frozenset(
+    {
+        "logseq.Editor.getAllPages",
+        "logseq.Editor.getPageBlocksTree",
+        "logseq.Editor.getPageLinkedReferences",
+        "logseq.App.search",
+        "logseq.DB.q",
+        "logseq.DB.datascriptQuery",
+    }
+)
+
+# Upper bound on read-cache entries (one per cached page plus the page list),
+# evicted least-recently-used first.
+_CACHE_MAX_ENTRIES = 64
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed.
+
+    Page lists and block trees can run to megabytes; orjson parses them
+    several times faster than the stdlib decoder behind ``response.json()``.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class LogSeqError(Exception):
+    """Base class for errors reported by the Logseq HTTP API."""
+
+
+class LogSeqHTTPError(LogSeqError, requests.HTTPError):
+    """The Logseq API answered with an HTTP error status.
+
+    Also a ``requests.HTTPError``, so existing ``except`` clauses keep
+    working. ``status`` lets callers branch (e.g. on 5xx) without parsing the
+    message, which is only formatted when the error is displayed.
+    """
+
+    def __init__(self, status: int, method: str, reason: str = "", *, response=None):
+        super().__init__(response=response)
+        self.status = status
+        self.method = method
+        self.reason = reason
+
+    def __str__(self) -> str:
+        status = f"{self.status} {self.reason}" if self.reason else str(self.status)
+        return f"Logseq API returned HTTP {status} for {self.method}"
+
 
 class LogSeq:
     def __init__(
@@ -15,6 +111,8 @@ class LogSeq:
         verify_ssl: bool = True,
         timeout: tuple[float, float] | None = None,
         db_mode: bool = False,
+        cache_ttl: float = 0,
+        bulk_timeout: tuple[float, float] | None = None,
     ):
         self.api_key = api_key
         self.protocol = protocol
@@ -23,12 +121,138 @@ class LogSeq:
         self.verify_ssl = verify_ssl
         self.db_mode = db_mode
         self.timeout = timeout or (3, 6)
+        self.bulk_timeout = bulk_timeout or self.timeout
+
+        # Built once rather than per call. IPv6 literals (which urlparse hands
+        # back without brackets) are re-bracketed so the URL stays parseable.
+        url_host = f"[{host}]" if ":" in host else host
+        self._base_url = f"{protocol}://{url_host}:{port}/api"
+
+        # Short-lived LRU read cache for hot, read-mostly calls (list_pages,
+        # get_page_content). Off when cache_ttl is 0. Entries are
+        # (timestamp, value); any write made through this client clears it,
+        # and _cache_generation lets a read that raced a write skip storing
+        # its now-stale result. The lock covers concurrent fan-out reads.
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+
+        # One pooled Session per client so consecutive API calls reuse a
+        # keep-alive connection instead of paying a TCP (and TLS) handshake
+        # each time. Auth headers are built once and stored on the session, so
+        # no request rebuilds or re-merges them.
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        # Every call targets the one Logseq host, so a single pool suffices.
+        # It is sized above the server's expected tool concurrency (worker
+        # threads plus get_pages_content fan-out) and blocks rather than
+        # opening throwaway sockets when a burst exceeds it.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            pool_block=True,
+            max_retries=_CONNECT_RETRY,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Release the pooled keep-alive connections."""
+        self._session.close()
+
+    def __enter__(self) -> "LogSeq":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached read result."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.clear()
+
+    def _cached(self, key: tuple, fetch) -> Any:
+        """Return ``fetch()``, reusing a result younger than ``cache_ttl``."""
+        if self.cache_ttl <= 0:
+            return fetch()
+
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+                self._cache.move_to_end(key)
+                return hit[1]
+            generation = self._cache_generation
+
+        value = fetch()
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = (time.monotonic(), value)
+                self._cache.move_to_end(key)
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return value
 
     def get_base_url(self) -> str:
-        return f"{self.protocol}://{self.host}:{self.port}/api"
-
-    def _get_headers(self) -> dict:
-        return {"Authorization": f"Bearer {self.api_key}"}
+        return self._base_url
+
+    def _post(self, method: str, args: list) -> requests.Response:
+        """POST one JSON-RPC call to ``/api`` and return the checked response.
+
+        The single place a request leaves this client: pooled session,
+        SSL-verify / timeout config (``bulk_timeout`` for ``_BULK_METHODS``),
+        retries of read methods on transient 502/503/504 answers and on
+        dropped connections (Logseq closes idle keep-alive sockets, so the
+        first call after a pause can hit one it already closed),
+        ``LogSeqHTTPError`` on error statuses, and read-cache invalidation
+        for mutating methods. Most callers want ``_call``; this is for the
+        few that must inspect the raw body.
+        """
+        attempts = 1 if method in _WRITE_METHODS else 1 + _READ_RETRIES
+        timeout = self.bulk_timeout if method in _BULK_METHODS else self.timeout
+        try:
+            for attempt in range(attempts):
+                try:
+                    response = self._session.post(
+                        self._base_url,
+                        json={"method": method, "args": args},
+                        verify=self.verify_ssl,
+                        timeout=timeout,
+                    )
+                except requests.ConnectionError as e:
+                    # Only reads get here more than once (writes have a
+                    # single attempt): a write may have reached Logseq.
+                    if attempt + 1 >= attempts:
+                        raise
+                    logger.warning(
+                        f"Connection to Logseq API dropped for {method}; "
+                        f"retrying: {e}"
+                    )
+                    time.sleep(_RETRY_BACKOFF * 2**attempt)
+                    continue
+                if (
+                    response.status_code in _RETRY_STATUSES
+                    and attempt + 1 < attempts
+                ):
+                    logger.warning(
+                        f"Logseq API returned HTTP {response.status_code} for "
+                        f"{method}; retrying"
+                    )
+                    response.close()
+                    time.sleep(_RETRY_BACKOFF * 2**attempt)
+                    continue
+                break
+            if response.status_code >= 400:
+                raise LogSeqHTTPError(
+                    response.status_code, method, response.reason, response=response
+                )
+            return response
+        finally:
+            # Invalidate even when a write fails: it may have partly applied.
+            if method in _WRITE_METHODS:
+                self.invalidate_cache()
 
     def _call(
         self, method: str, args: list, *, error_context: str | None = None
@@ -36,8 +260,7 @@ class LogSeq:
         """Execute a single Logseq HTTP-API JSON-RPC call.
 
         Owns the request boilerplate shared by nearly every endpoint wrapper:
-        the POST to ``/api`` with auth headers, the SSL-verify / timeout config,
-        ``raise_for_status()`` and JSON decoding.
+        the POST via ``_post()`` and JSON decoding of the response.
 
         On failure it logs ``"Error {error_context}: ..."`` when an
         ``error_context`` is supplied (preserving each caller's historical log
@@ -56,15 +279,7 @@ class LogSeq:
             The decoded JSON payload of the response.
         """
         try:
-            response = requests.post(
-                self.get_base_url(),
-                headers=self._get_headers(),
-                json={"method": method, "args": args},
-                verify=self.verify_ssl,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.json()
+            return _decode_json(self._post(method, args))
         except Exception as e:
             if error_context:
                 logger.error(f"Error {error_context}: {str(e)}")
@@ -103,15 +318,42 @@ class LogSeq:
             )
         )
 
-    def list_pages(self) -> Any:
-        """List all pages in the LogSeq graph."""
+    def list_pages(self, *, fresh: bool = False) -> Any:
+        """List all pages in the LogSeq graph.
+
+        Served from the read cache when ``cache_ttl`` is set. Pass
+        ``fresh=True`` where a stale answer is not acceptable (e.g. access
+        decisions built from page tags); write paths that validate existence
+        use ``_fetch_all_pages()`` directly.
+        """
+        if fresh:
+            return self._fetch_all_pages()
+        return self._cached(("list_pages",), self._fetch_all_pages)
+
+    def _fetch_all_pages(self) -> Any:
+        """List all pages straight from the API, bypassing the read cache."""
         logger.info("Listing pages")
         return self._call(
             "logseq.Editor.getAllPages", [], error_context="listing pages"
         )
 
-    def get_page_content(self, page_name: str) -> Any:
-        """Get content of a LogSeq page including metadata and block content."""
+    def get_page_content(self, page_name: str, *, fresh: bool = False) -> Any:
+        """Get content of a LogSeq page including metadata and block content.
+
+        Served from the read cache when ``cache_ttl`` is set, so an LLM
+        re-reading the same page skips both round-trips. Pass ``fresh=True``
+        where a stale answer is not acceptable (e.g. ACL checks before a
+        write).
+        """
+        if fresh:
+            return self._fetch_page_content(page_name)
+        return self._cached(
+            ("page_content", page_name),
+            lambda: self._fetch_page_content(page_name),
+        )
+
+    def _fetch_page_content(self, page_name: str) -> Any:
+        """Fetch a page and its block tree straight from the API."""
         logger.info(f"Getting content for page '{page_name}'")
 
         # Step 1: Get page metadata (includes UUID)
@@ -143,6 +385,30 @@ class LogSeq:
             "blocks": blocks or [],
         }
 
+    def get_pages_content(
+        self, page_names: list[str], max_workers: int = 8, *, fresh: bool = False
+    ) -> list[Any]:
+        """Get content for several pages concurrently.
+
+        Each page is fetched with ``get_page_content`` on a worker thread, all
+        sharing this client's pooled session, so N pages cost roughly one
+        round-trip of wall time instead of N. Results follow the order of
+        ``page_names`` (``None`` for missing pages); the first failure is
+        re-raised. ``fresh`` is passed through to ``get_page_content``.
+        """
+        logger.info(f"Getting content for {len(page_names)} pages")
+        if not page_names:
+            return []
+
+        workers = min(max_workers, len(page_names))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda name: self.get_page_content(name, fresh=fresh),
+                    page_names,
+                )
+            )
+
     def search_content(self, query: str, options: dict | None = None) -> Any:
         """Search for content across LogSeq pages and blocks."""
         logger.info(f"Searching for '{query}'")
@@ -161,7 +427,7 @@ class LogSeq:
         logger.info(f"Deleting page '{page_name}'")
 
         # Pre-delete validation: verify page exists
-        existing_pages = self.list_pages()
+        existing_pages = self._fetch_all_pages()
         page_names = [
             p.get("originalName") or p.get("name")
             for p in existing_pages
@@ -389,15 +655,12 @@ class LogSeq:
             f"Updating page '{page_name}' with {len(blocks)} blocks (mode={mode})"
         )
 
-        # Validate page exists
-        existing_pages = self.list_pages()
-        page_names = [
-            p.get("originalName") or p.get("name")
-            for p in existing_pages
-            if p.get("originalName") or p.get("name")
-        ]
-
-        if page_name not in page_names:
+        # Validate page exists: one getPage lookup rather than pulling the
+        # whole graph's page list. The name must still match the page's
+        # display name (originalName, else name) exactly, as the list-based
+        # check required; getPage itself matches case-insensitively.
+        page = self._call("logseq.Editor.getPage", [page_name])
+        if not page or page_name != (page.get("originalName") or page.get("name")):
             raise ValueError(f"Page '{page_name}' does not exist")
 
         results: list[tuple[str, Any]] = []
@@ -462,7 +725,10 @@ class LogSeq:
             #     representation and updates values in place.
             if properties:
                 if mode == "append":
-                    existing_props = self._get_page_level_properties(page_name)
+                    # The page entity fetched for the existence check already
+                    # carries the page-level properties, and inserting blocks
+                    # does not change them, so no second getPage is needed.
+                    existing_props = page.get("properties") or {}
                     merged_props = {**existing_props, **properties}
                     if self.db_mode:
                         self._set_page_level_properties(page_name, merged_props)
@@ -507,21 +773,6 @@ class LogSeq:
 
         return value
 
-    def _get_page_level_properties(self, page_name: str) -> dict:
-        """
-        Get page-level properties from the page entity (not from the first block).
-
-        Uses getPage which returns the page entity with its page-level properties.
-        """
-        try:
-            page = self._call("logseq.Editor.getPage", [page_name])
-            if page and isinstance(page, dict):
-                return page.get("properties", {}) or {}
-            return {}
-        except Exception as e:
-            logger.warning(f"Could not get page-level properties for '{page_name}': {e}")
-            return {}
-
     def _set_page_level_properties(self, page_name: str, properties: dict) -> None:
         """
         Set page-level properties via the setPageProperties API.
@@ -1029,12 +1280,11 @@ class LogSeq:
 
     def rename_page(self, old_name: str, new_name: str) -> Any:
         """Rename a page and update all references."""
-        url = self.get_base_url()
         logger.info(f"Renaming page '{old_name}' to '{new_name}'")
 
         try:
             # Validate old page exists
-            existing_pages = self.list_pages()
+            existing_pages = self._fetch_all_pages()
             page_names = [p.get("originalName") or p.get("name") for p in existing_pages]
 
             if old_name not in page_names:
@@ -1043,23 +1293,15 @@ class LogSeq:
             if new_name in page_names:
                 raise ValueError(f"Page '{new_name}' already exists")
 
-            # Kept as a direct POST (not routed through _call): renamePage returns
-            # null on success, so we inspect the raw response text to distinguish a
-            # null/empty body from a JSON payload rather than calling .json() blindly.
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.renamePage",
-                    "args": [old_name, new_name]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
+            # Uses _post rather than _call: renamePage returns null on success,
+            # so we inspect the raw response text to distinguish a null/empty
+            # body from a JSON payload rather than calling .json() blindly.
+            response = self._post(
+                "logseq.Editor.renamePage", [old_name, new_name]
             )
-            response.raise_for_status()
             # renamePage returns null on success
             if response.text and response.text.strip() and response.text.strip() != 'null':
-                return response.json()
+                return _decode_json(response)
             return None
 
         except ValueError:
@@ -81,6 +81,26 @@ FENCED_CODE_END = re.compile(r"^(\s*)```\s*$")
 TABLE_ROW_PATTERN = re.compile(r"^\s*\|.+\|\s*$")
 DISPLAY_MATH_DELIMITER = re.compile(r"^\s*\$\$\s*$")
 
+# Any line that starts a non-paragraph element. One alternation of the
+# patterns above, so a paragraph line costs one regex match, not ten.
+PARAGRAPH_BREAK_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern.pattern})"
+        for pattern in (
+            HEADING_PATTERN,
+            BULLET_PATTERN,
+            NUMBERED_PATTERN,
+            CHECKBOX_PATTERN,
+            BLOCKQUOTE_PATTERN,
+            HORIZONTAL_RULE_PATTERN,
+            FENCED_CODE_START,
+            DISPLAY_MATH_DELIMITER,
+            LOGSEQ_PROPERTY_PATTERN,
+            TABLE_ROW_PATTERN,
+        )
+    )
+)
+
 
 def _serialize_frontmatter_value(obj: Any) -> Any:
     """
@@ -586,18 +606,7 @@ class MarkdownParser:
                 break
 
             # Check if this line starts a special element
-            if (
-                HEADING_PATTERN.match(line)
-                or BULLET_PATTERN.match(line)
-                or NUMBERED_PATTERN.match(line)
-                or CHECKBOX_PATTERN.match(line)
-                or BLOCKQUOTE_PATTERN.match(line)
-                or HORIZONTAL_RULE_PATTERN.match(line)
-                or FENCED_CODE_START.match(line)
-                or DISPLAY_MATH_DELIMITER.match(line)
-                or LOGSEQ_PROPERTY_PATTERN.match(line)
-                or TABLE_ROW_PATTERN.match(line)
-            ):
+            if PARAGRAPH_BREAK_PATTERN.match(line):
                 break
 
             paragraph_lines.append(line.strip())
@@ -49,6 +49,7 @@ _WRITE_TOOL_NAMES = frozenset(
         "create_page",
         "update_page",
         "delete_page",
+        "bulk_pages",
         "rename_page",
         "update_block",
         "delete_block",
@@ -83,7 +84,9 @@ def _register_all_tool_handlers(handlers: dict, read_only: bool = False) -> None
     add(tools.UpdatePageToolHandler())
     add(tools.ListPagesToolHandler())
     add(tools.GetPageContentToolHandler())
+    add(tools.GetPagesContentToolHandler())
     add(tools.DeletePageToolHandler())
+    add(tools.BulkPagesToolHandler())
     add(tools.DeleteBlockToolHandler())
     add(tools.UpdateBlockToolHandler())
     add(tools.GetBlockToolHandler())
@@ -145,7 +148,7 @@ def build_app(read_only: bool = False) -> tuple[Server, dict]:
     async def list_tools() -> list[Tool]:
         """List available tools."""
         logger.debug("Listing tools")
-        tools_list = [th.get_tool_description() for th in handlers.values()]
+        tools_list = [th.tool_description for th in handlers.values()]
         logger.debug(f"Found {len(tools_list)} tools")
         return tools_list
 
@@ -167,8 +170,17 @@ def build_app(read_only: bool = False) -> tuple[Server, dict]:
 
         try:
             logger.debug(f"Running tool {name}")
+            # Handlers are synchronous (blocking HTTP to Logseq). Running each one
+            # in a worker thread keeps the event loop free, so concurrent tool
+            # calls overlap their network waits on the shared pooled client.
             result = await asyncio.to_thread(tool_handler.run_tool, arguments)
-            logger.debug(f"Tool result: {result}")
+            # Log the size, not the payload: the root logger runs at DEBUG,
+            # so formatting a whole page or search dump here would cost a
+            # full repr and two writes (stderr + log file) on every call.
+            logger.debug(
+                f"Tool result: {len(result)} item(s), "
+                f"{sum(len(getattr(c, 'text', '')) for c in result)} chars"
+            )
             return result
         except Exception as e:
             logger.error(f"Error running tool: {str(e)}", exc_info=True)
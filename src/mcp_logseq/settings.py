@@ -26,14 +26,22 @@ class Settings:
     verify_ssl: bool
     connect_timeout: float
     read_timeout: float
+    bulk_read_timeout: float
     db_mode: bool
+    cache_ttl: float
 
     @property
     def timeout(self) -> tuple[float, float]:
         return (self.connect_timeout, self.read_timeout)
 
+    @property
+    def bulk_timeout(self) -> tuple[float, float]:
+        return (self.connect_timeout, self.bulk_read_timeout)
+
 
-def _parse_positive_float_env(name: str, default: float) -> float:
+def _parse_positive_float_env(
+    name: str, default: float, *, allow_zero: bool = False
+) -> float:
     raw_value = os.getenv(name, "").strip()
     if not raw_value:
         return default
@@ -43,9 +51,15 @@ def _parse_positive_float_env(name: str, default: float) -> float:
     except ValueError:
         value = None
 
-    if value is None or not math.isfinite(value) or value <= 0:
+    if (
+        value is None
+        or not math.isfinite(value)
+        or value < 0
+        or (value == 0 and not allow_zero)
+    ):
+        kind = "non-negative" if allow_zero else "positive"
         logger.warning(
-            f"{name} must be a positive number of seconds, got {raw_value!r}; "
+            f"{name} must be a {kind} number of seconds, got {raw_value!r}; "
             f"falling back to default {default}"
         )
         return default
@@ -72,6 +86,8 @@ def load_settings() -> Settings:
     else:
         verify_ssl = protocol == "https"
 
+    read_timeout = _parse_positive_float_env("LOGSEQ_API_READ_TIMEOUT", 6)
+
     return Settings(
         api_key=api_key,
         protocol=protocol,
@@ -79,8 +95,17 @@ def load_settings() -> Settings:
         port=parsed_url.port or 12315,
         verify_ssl=verify_ssl,
         connect_timeout=_parse_positive_float_env("LOGSEQ_API_CONNECT_TIMEOUT", 3),
-        read_timeout=_parse_positive_float_env("LOGSEQ_API_READ_TIMEOUT", 6),
+        read_timeout=read_timeout,
+        # Bulk reads are the slow ones, so never give them less time than
+        # ordinary reads, even when set explicitly.
+        bulk_read_timeout=max(
+            read_timeout,
+            _parse_positive_float_env("LOGSEQ_API_BULK_READ_TIMEOUT", 20),
+        ),
         db_mode=os.getenv("LOGSEQ_DB_MODE", "").lower() in ("1", "true", "yes"),
+        cache_ttl=_parse_positive_float_env(
+            "LOGSEQ_API_CACHE_TTL", 30, allow_zero=True
+        ),
     )
 
 
@@ -36,8 +36,10 @@ from .pages import (
     CreatePageToolHandler,
     ListPagesToolHandler,
     GetPageContentToolHandler,
+    GetPagesContentToolHandler,
     DeletePageToolHandler,
     UpdatePageToolHandler,
+    BulkPagesToolHandler,
     FindPagesByPropertyToolHandler,
     RenamePageToolHandler,
     GetPageBacklinksToolHandler,
@@ -64,8 +66,10 @@ __all__ = [
     "CreatePageToolHandler",
     "ListPagesToolHandler",
     "GetPageContentToolHandler",
+    "GetPagesContentToolHandler",
     "DeletePageToolHandler",
     "UpdatePageToolHandler",
+    "BulkPagesToolHandler",
     "DeleteBlockToolHandler",
     "UpdateBlockToolHandler",
     "GetBlockToolHandler",
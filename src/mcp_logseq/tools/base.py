@@ -9,21 +9,53 @@ package namespace (``_t._make_api()``) for the same reason.
 """
 
 import re
+import json
+import functools
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional: pip install "mcp-logseq[fast]"
+    orjson = None
+
 from .. import logseq
-from ..settings import get_settings
+from ..settings import Settings, get_settings
 from mcp.types import Tool, TextContent
 
 logger = logging.getLogger("mcp-logseq")
 
 
+def _dump_json(obj) -> str:
+    """Serialize a tool's JSON-format output with 2-space indentation.
+
+    Uses orjson when it is installed (several times faster on large search
+    and page payloads) and the stdlib encoder otherwise. Both emit non-ASCII
+    text unescaped so the output does not depend on which one ran. orjson
+    refuses to nest deeper than 254 levels (a block tree of ~128 levels), so
+    anything it rejects is retried with the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def _get_db_mode() -> bool:
     return get_settings().db_mode
 
 
-def _make_api() -> logseq.LogSeq:
-    settings = get_settings()
+@functools.lru_cache(maxsize=1)
+def _client_for(settings: Settings) -> logseq.LogSeq:
+    """Build the shared API client for ``settings``.
+
+    Cached so every tool call reuses one client (and its pooled keep-alive
+    connections); a change in settings yields a fresh client. Call
+    ``_client_for.cache_clear()`` (tests) to drop the cached instance.
+    """
     return logseq.LogSeq(
         api_key=settings.api_key,
         protocol=settings.protocol,
@@ -31,10 +63,16 @@ def _make_api() -> logseq.LogSeq:
         port=settings.port,
         verify_ssl=settings.verify_ssl,
         timeout=settings.timeout,
+        bulk_timeout=settings.bulk_timeout,
         db_mode=settings.db_mode,
+        cache_ttl=settings.cache_ttl,
     )
 
 
+def _make_api() -> logseq.LogSeq:
+    return _client_for(get_settings())
+
+
 # Regex matching [[uuid]] references in DB-mode block content
 _UUID_REF_PATTERN = re.compile(r"\[\[([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\]\]")
 
@@ -63,6 +101,11 @@ def _resolve_block_refs(content: str, uuid_map: dict[str, str]) -> str:
     return _UUID_REF_PATTERN.sub(_replace, content)
 
 
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most ``limit`` characters, marking the cut with "..."."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
 class ToolHandler:
     #: Declarative pre-dispatch access checks (architecture review A4). Each
     #: handler lists the ``access.AccessPolicy`` objects that gate it; the base
@@ -78,8 +121,40 @@ class ToolHandler:
     def get_tool_description(self) -> Tool:
         raise NotImplementedError()
 
+    @functools.cached_property
+    def tool_description(self) -> Tool:
+        """``get_tool_description()``, built once per handler and reused.
+
+        Descriptions are static, so ``list_tools`` hands out this one object
+        instead of rebuilding the ``Tool`` and its schema on every request.
+        """
+        return self.get_tool_description()
+
+    @functools.cached_property
+    def _required_args(self) -> tuple[str, ...]:
+        """The ``required`` list from this tool's input schema.
+
+        A handler that declares no description has nothing to validate.
+        """
+        try:
+            tool = self.tool_description
+        except NotImplementedError:
+            return ()
+        return tuple(tool.inputSchema.get("required", []))
+
+    def _check_required_args(self, args: dict) -> None:
+        """Raise ``RuntimeError`` if any schema-required argument is missing."""
+        required = self._required_args
+        if any(key not in args for key in required):
+            if len(required) == 1:
+                raise RuntimeError(f"{required[0]} argument required")
+            raise RuntimeError(f"{' and '.join(required)} arguments required")
+
     def run_tool(self, args: dict) -> list[TextContent]:
-        """Enforce the declared access policy, then dispatch to ``_run``.
+        """Validate required args, enforce the access policy, then ``_run``.
+
+        Required arguments come from the ``inputSchema`` each handler already
+        declares, so handlers do not re-check them by hand.
 
         This is the single choke point for pre-dispatch access control: the API
         client is built once, every declared policy runs against it (raising
@@ -93,6 +168,7 @@ class ToolHandler:
         """
         import mcp_logseq.tools as _t
 
+        self._check_required_args(args)
         api = _t._make_api()
         for policy in self.access_policy:
             policy.enforce(api, args)
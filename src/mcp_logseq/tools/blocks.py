@@ -1,12 +1,10 @@
 """Block-level tool handlers (delete, update, get, insert nested, set properties)."""
 
-import json
-
 from mcp.types import Tool, TextContent
 
 import mcp_logseq.tools as _t
 from .. import access
-from .base import ToolHandler, logger
+from .base import ToolHandler, logger, _dump_json, _truncate
 # GetBlock reuses GetPageContent's block-tree formatter.
 from .pages import GetPageContentToolHandler
 
@@ -37,9 +35,6 @@ class DeleteBlockToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "block_uuid" not in args:
-            raise RuntimeError("block_uuid argument required")
-
         block_uuid = args["block_uuid"]
 
         try:
@@ -92,9 +87,6 @@ class UpdateBlockToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "block_uuid" not in args or "content" not in args:
-            raise RuntimeError("block_uuid and content arguments required")
-
         block_uuid = args["block_uuid"]
         content = args["content"]
 
@@ -157,9 +149,6 @@ class GetBlockToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "block_uuid" not in args:
-            raise RuntimeError("block_uuid argument required")
-
         block_uuid = args["block_uuid"]
         include_children = args.get("include_children", True)
         output_format = args.get("format", "text")
@@ -168,10 +157,7 @@ class GetBlockToolHandler(ToolHandler):
             result = api.get_block(block_uuid, include_children=include_children)
 
             if output_format == "json":
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-            # Format as readable text using the same tree formatter as get_page_content
-            content_parts = []
+                return [TextContent(type="text", text=_dump_json(result))]
 
             # Fetch DB-mode class properties when enabled
             db_properties = {}
@@ -182,10 +168,10 @@ class GetBlockToolHandler(ToolHandler):
                 except Exception as e:
                     logger.warning(f"Could not fetch DB-mode properties: {e}")
 
-            block_lines = GetPageContentToolHandler._format_block_tree(
+            # Format as readable text using the same tree formatter as get_page_content
+            content_parts = GetPageContentToolHandler._format_block_tree(
                 result, 0, -1, db_properties
             )
-            content_parts.extend(block_lines)
 
             if not content_parts:
                 return [TextContent(
@@ -246,9 +232,6 @@ class InsertNestedBlockToolHandler(ToolHandler):
 
     def _run(self, api, args: dict) -> list[TextContent]:
         """Insert a nested block under an existing block."""
-        if "parent_block_uuid" not in args or "content" not in args:
-            raise RuntimeError("parent_block_uuid and content arguments required")
-
         parent_uuid = args["parent_block_uuid"]
         content = args["content"]
         properties = args.get("properties")
@@ -263,23 +246,21 @@ class InsertNestedBlockToolHandler(ToolHandler):
             )
 
             relationship = "sibling" if sibling else "child"
-            success_msg = f"✅ Successfully inserted block as {relationship}"
+            msg_parts = [f"✅ Successfully inserted block as {relationship}"]
 
             # Add block details if available
             if result and isinstance(result, dict):
                 if result.get("uuid"):
-                    success_msg += f"\n🆔 New block UUID: {result.get('uuid')}"
+                    msg_parts.append(f"🆔 New block UUID: {result.get('uuid')}")
                 if result.get("content"):
-                    content_preview = result.get('content')
-                    if len(content_preview) > 100:
-                        content_preview = content_preview[:100] + "..."
-                    success_msg += f"\n📝 Content: {content_preview}"
+                    content_preview = _truncate(result.get('content'), 100)
+                    msg_parts.append(f"📝 Content: {content_preview}")
 
-            success_msg += f"\n🔗 Inserted under parent: {parent_uuid}"
+            msg_parts.append(f"🔗 Inserted under parent: {parent_uuid}")
 
             return [TextContent(
                 type="text",
-                text=success_msg
+                text="\n".join(msg_parts)
             )]
 
         except ValueError as e:
@@ -325,6 +306,15 @@ class SetBlockPropertiesToolHandler(ToolHandler):
             },
         )
 
+    def _check_required_args(self, args: dict) -> None:
+        """Validate arguments only in DB mode.
+
+        Outside DB mode the tool's only answer is that it needs DB mode (see
+        ``_run``), so that error takes precedence over a missing argument.
+        """
+        if _t._get_db_mode():
+            super()._check_required_args(args)
+
     def _run(self, api, args: dict) -> list[TextContent]:
         """Set DB-mode properties on a block."""
         if not _t._get_db_mode():
@@ -333,9 +323,6 @@ class SetBlockPropertiesToolHandler(ToolHandler):
                 text="❌ set_block_properties requires LOGSEQ_DB_MODE=true (only works with Logseq DB-mode graphs)",
             )]
 
-        if "block_uuid" not in args or "properties" not in args:
-            raise RuntimeError("block_uuid and properties arguments required")
-
         block_uuid = args["block_uuid"]
         properties = args["properties"]
 
@@ -6,7 +6,7 @@ from .. import access
 from ..access import (
     is_page_blocked as _is_page_blocked,
 )
-from .base import ToolHandler, logger
+from .base import ToolHandler, logger, _dump_json
 
 
 class GetPagesFromNamespaceToolHandler(ToolHandler):
@@ -33,34 +33,25 @@ class GetPagesFromNamespaceToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "namespace" not in args:
-            raise RuntimeError("namespace argument required")
-
         try:
             result = api.get_pages_from_namespace(args["namespace"])
 
             # Security: silently drop pages blocked by tag OR namespace, e.g. an
             # excluded sub-namespace (work/secret) under an allowed parent (work).
-            if result:
-                result = [
-                    p for p in result
-                    if not _is_page_blocked(p, p.get('originalName') or p.get('name') or '')
-                ]
-
-            if not result:
+            # Each page's name is resolved once for both the check and display.
+            pages_info = sorted(
+                f"- {name or '<unknown>'}"
+                for page in result or ()
+                for name in (page.get('originalName') or page.get('name') or '',)
+                if not _is_page_blocked(page, name)
+            )
+
+            if not pages_info:
                 return [TextContent(
                     type="text",
                     text=f"No pages found in namespace '{args['namespace']}'"
                 )]
 
-            # Format pages for display
-            pages_info = []
-            for page in result:
-                name = page.get('originalName') or page.get('name', '<unknown>')
-                pages_info.append(f"- {name}")
-
-            pages_info.sort()
-
             response = f"Pages in namespace '{args['namespace']}':\n\n"
             response += "\n".join(pages_info)
             response += f"\n\nTotal: {len(pages_info)} pages"
@@ -89,16 +80,19 @@ class GetPagesTreeFromNamespaceToolHandler(ToolHandler):
                     "namespace": {
                         "type": "string",
                         "description": "The root namespace to build tree from (e.g., 'Projects')"
-                    }
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Output format (text or json)",
+                        "enum": ["text", "json"],
+                        "default": "text",
+                    },
                 },
                 "required": ["namespace"]
             }
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "namespace" not in args:
-            raise RuntimeError("namespace argument required")
-
         try:
             result = api.get_pages_tree_from_namespace(args["namespace"])
 
@@ -125,31 +119,43 @@ class GetPagesTreeFromNamespaceToolHandler(ToolHandler):
                     text=f"No pages found in namespace '{args['namespace']}'"
                 )]
 
-            # Format as tree structure
-            def format_tree(pages, prefix="", is_last_list=None):
-                if is_last_list is None:
-                    is_last_list = []
+            # JSON callers get the pruned tree as-is; no text rendering needed.
+            if args.get("format") == "json":
+                return [TextContent(type="text", text=_dump_json(result))]
+
+            # Format as tree structure. Iterative depth-first walk: children
+            # are pushed in reverse so the first child is popped (and printed)
+            # first, giving the same pre-order as a recursive walk without a
+            # Python frame per level.
+            def format_tree(pages):
                 lines = []
-                for i, page in enumerate(pages):
-                    is_last = i == len(pages) - 1
+                append = lines.append
+                last = len(pages) - 1
+                stack = [(page, "", i == last) for i, page in enumerate(pages)]
+                stack.reverse()
+                while stack:
+                    page, prefix, is_last = stack.pop()
                     name = page.get('originalName') or page.get('name', '<unknown>')
 
                     # Build the prefix for this line
                     if prefix == "":
-                        lines.append(name)
+                        append(name)
                     else:
                         connector = "└── " if is_last else "├── "
-                        lines.append(f"{prefix}{connector}{name}")
+                        append(f"{prefix}{connector}{name}")
 
-                    # Handle children if present
+                    # Queue children if present
                     children = page.get('children', [])
                     if children:
-                        # Build prefix for children
                         if prefix == "":
                             child_prefix = ""
                         else:
                             child_prefix = prefix + ("    " if is_last else "│   ")
-                        lines.extend(format_tree(children, child_prefix, is_last_list + [is_last]))
+                        last = len(children) - 1
+                        stack.extend(
+                            (child, child_prefix, i == last)
+                            for i, child in reversed(list(enumerate(children)))
+                        )
                 return lines
 
             tree_lines = format_tree(result)
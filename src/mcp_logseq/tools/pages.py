@@ -18,8 +18,14 @@ from .base import (
     _UUID_REF_PATTERN,
     _collect_block_uuids,
     _resolve_block_refs,
+    _dump_json,
+    _truncate,
 )
 
+# Property names are spliced into DSL queries unquoted, so only plain
+# identifiers are accepted.
+_PROPERTY_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
+
 
 class CreatePageToolHandler(ToolHandler):
     """
@@ -86,51 +92,56 @@ Introduction paragraph.
             },
         )
 
-    def _run(self, api, args: dict) -> list[TextContent]:
-        if "title" not in args:
-            raise RuntimeError("title argument required")
+    @staticmethod
+    def _create_page(api, args: dict) -> str:
+        """Create the page described by ``args``; return the success message.
 
+        Raises on failure. Shared with ``bulk_pages``.
+        """
         title = args["title"]
         content = args.get("content", "")
         explicit_properties = args.get("properties", {})
 
-        try:
-            # Refuse to create a duplicate: Logseq auto-numbers pages with an
-            # existing name ("Page(1)", "Page 2"), which silently fragments
-            # content when a timed-out create_page is retried (issue #58).
-            if api.page_exists(title):
-                raise ValueError(
-                    f"Page '{title}' already exists. Use update_page to modify "
-                    "it (mode='append' or mode='replace'), or get_page_content "
-                    "to inspect it. If a previous create_page call timed out, "
-                    "the page may already contain the content you sent."
-                )
-
-            # Parse the content
-            parsed = (
-                parser.parse_content(content) if content else parser.ParsedContent()
+        # Refuse to create a duplicate: Logseq auto-numbers pages with an
+        # existing name ("Page(1)", "Page 2"), which silently fragments
+        # content when a timed-out create_page is retried (issue #58).
+        if api.page_exists(title):
+            raise ValueError(
+                f"Page '{title}' already exists. Use update_page to modify "
+                "it (mode='append' or mode='replace'), or get_page_content "
+                "to inspect it. If a previous create_page call timed out, "
+                "the page may already contain the content you sent."
             )
 
-            # Merge properties: explicit properties override frontmatter
-            page_properties = {**parsed.properties, **explicit_properties}
+        # Parse the content
+        parsed = (
+            parser.parse_content(content) if content else parser.ParsedContent()
+        )
 
-            # Convert blocks to batch format
-            blocks = parsed.to_batch_format()
+        # Merge properties: explicit properties override frontmatter
+        page_properties = {**parsed.properties, **explicit_properties}
+
+        # Convert blocks to batch format
+        blocks = parsed.to_batch_format()
+
+        # Create the page with blocks
+        api.create_page_with_blocks(title, blocks, page_properties)
 
-            # Create the page with blocks
-            api.create_page_with_blocks(title, blocks, page_properties)
+        # Build success message
+        block_count = len(blocks)
+        prop_count = len(page_properties)
 
-            # Build success message
-            block_count = len(blocks)
-            prop_count = len(page_properties)
+        msg_parts = [f"Successfully created page '{title}'"]
+        if block_count > 0:
+            msg_parts.append(f"  - {block_count} top-level block(s) created")
+        if prop_count > 0:
+            msg_parts.append(f"  - {prop_count} page property/ies set")
 
-            msg_parts = [f"Successfully created page '{title}'"]
-            if block_count > 0:
-                msg_parts.append(f"  - {block_count} top-level block(s) created")
-            if prop_count > 0:
-                msg_parts.append(f"  - {prop_count} page property/ies set")
+        return "\n".join(msg_parts)
 
-            return [TextContent(type="text", text="\n".join(msg_parts))]
+    def _run(self, api, args: dict) -> list[TextContent]:
+        try:
+            return [TextContent(type="text", text=self._create_page(api, args))]
         except Exception as e:
             logger.error(f"Failed to create page: {str(e)}")
             raise
@@ -164,32 +175,28 @@ class ListPagesToolHandler(ToolHandler):
         include_journals = args.get("include_journals", False)
 
         try:
-            result = api.list_pages()
-
-            # Format pages for display
-            pages_info = []
-            for page in result:
-                # Skip if it's a journal page and we don't want to include those
-                is_journal = page.get("journal?", False)
-                if is_journal and not include_journals:
-                    continue
-                # Security: pages blocked by tag OR namespace are invisible
-                name_for_check = page.get("originalName") or page.get("name", "")
-                if _is_page_blocked(page, name_for_check):
-                    continue
-
-                # Get page information
-                name = page.get("originalName") or page.get("name", "<unknown>")
-
-                # Build page info string
-                info_parts = [f"- {name}"]
-                if is_journal:
-                    info_parts.append("[journal]")
-
-                pages_info.append(" ".join(info_parts))
-
-            # Sort alphabetically by page name
-            pages_info.sort()
+            # Access rules filter on page tags, so read the list fresh when any
+            # are configured; otherwise the cached list is fine.
+            result = api.list_pages(fresh=access.get_access_config().has_rules)
+
+            # Format pages for display, sorted case-insensitively by page
+            # name (not by the rendered line, so the "[journal]" suffix never
+            # affects order). Journal pages are skipped unless requested; pages
+            # blocked by tag OR namespace are invisible. Each page's name is
+            # resolved once and shared by the access check and the display line.
+            rows = sorted(
+                (
+                    name.casefold(),
+                    f"- {name or '<unknown>'} [journal]" if is_journal
+                    else f"- {name or '<unknown>'}",
+                )
+                for page in result
+                for is_journal in (page.get("journal?", False),)
+                if include_journals or not is_journal
+                for name in (page.get("originalName") or page.get("name", ""),)
+                if not _is_page_blocked(page, name)
+            )
+            pages_info = [line for _, line in rows]
 
             # Build response
             count_msg = f"\nTotal pages: {len(pages_info)}"
@@ -199,9 +206,10 @@ class ListPagesToolHandler(ToolHandler):
                 else " (including journal pages)"
             )
 
-            response = (
-                "LogSeq Pages:\n\n" + "\n".join(pages_info) + count_msg + journal_msg
-            )
+            # One f-string builds the response in a single allocation; chained
+            # "+" would copy the (possibly large) page list once per operand.
+            listing = "\n".join(pages_info)
+            response = f"LogSeq Pages:\n\n{listing}{count_msg}{journal_msg}"
 
             return [TextContent(type="text", text=response)]
 
@@ -225,12 +233,15 @@ class GetPageContentToolHandler(ToolHandler):
         uuid_map: dict[str, str] | None = None,
     ) -> list[str]:
         """
-        Recursively format a block and its children with proper indentation.
+        Format a block and its children with proper indentation.
+
+        Walks the tree depth-first with an explicit stack, so deeply nested
+        pages neither pay a Python frame per block nor hit the recursion limit.
 
         Args:
             block: Block dict with 'content', 'children', and optional 'properties', 'marker'
             indent_level: Current indentation level (0-based)
-            max_depth: Maximum depth to recurse (-1 for unlimited)
+            max_depth: Maximum depth to descend (-1 for unlimited)
             db_properties: DB-mode class properties keyed by block UUID
             uuid_map: Mapping of page UUIDs to page names for resolving [[uuid]] refs
 
@@ -238,51 +249,54 @@ class GetPageContentToolHandler(ToolHandler):
             List of formatted lines for this block and its children
         """
         lines = []
+        db_mode = _t._get_db_mode()
+
+        stack = [(block, indent_level)]
+        while stack:
+            block, level = stack.pop()
+
+            # Get block content
+            content = block.get("content", "").strip()
+
+            # Resolve [[uuid]] references to [[Page Name]] if a map is provided
+            if uuid_map and content:
+                content = _resolve_block_refs(content, uuid_map)
+            # An empty block hides its whole subtree
+            if not content:
+                continue
+
+            # Build the formatted line with indentation.
+            # Skip adding "- " if the content already starts with it to avoid
+            # double-wrapping blocks whose text begins with a list marker.
+            indent = "  " * level
+            if content.startswith(("- ", "* ", "+ ")) or content in ("-", "*", "+"):
+                line = f"{indent}{content}"
+            else:
+                line = f"{indent}- {content}"
+            lines.append(line)
+
+            # In DB-mode, properties are NOT embedded in content — render from dict
+            # In Markdown-mode, properties are already in block content — skip to avoid duplicates
+            if db_mode:
+                properties = block.get("properties", {})
+                if properties:
+                    for key, value in properties.items():
+                        if isinstance(key, str) and key.startswith(":logseq"):
+                            continue
+                        if f"{key}::" not in content:
+                            lines.append(f"{indent}  {key}:: {value}")
 
-        # Get block content
-        content = block.get("content", "").strip()
-
-        # Resolve [[uuid]] references to [[Page Name]] if a map is provided
-        if uuid_map and content:
-            content = _resolve_block_refs(content, uuid_map)
-        if not content:
-            return lines
-
-        # Build the formatted line with indentation.
-        # Skip adding "- " if the content already starts with it to avoid
-        # double-wrapping blocks whose text begins with a list marker.
-        indent = "  " * indent_level
-        if content.startswith(("- ", "* ", "+ ")) or content in ("-", "*", "+"):
-            line = f"{indent}{content}"
-        else:
-            line = f"{indent}- {content}"
-        lines.append(line)
-
-        # In DB-mode, properties are NOT embedded in content — render from dict
-        # In Markdown-mode, properties are already in block content — skip to avoid duplicates
-        if _t._get_db_mode():
-            properties = block.get("properties", {})
-            if properties:
-                for key, value in properties.items():
-                    if isinstance(key, str) and key.startswith(":logseq"):
-                        continue
-                    if f"{key}::" not in content:
+                # DB-mode class properties (from datascript query)
+                block_uuid = str(block.get("uuid", ""))
+                if db_properties and block_uuid in db_properties:
+                    for key, value in db_properties[block_uuid].items():
                         lines.append(f"{indent}  {key}:: {value}")
 
-            # DB-mode class properties (from datascript query)
-            block_uuid = str(block.get("uuid", ""))
-            if db_properties and block_uuid in db_properties:
-                for key, value in db_properties[block_uuid].items():
-                    lines.append(f"{indent}  {key}:: {value}")
-
-        # Process children if we haven't hit the depth limit
-        children = block.get("children", [])
-        if children and (max_depth == -1 or indent_level < max_depth):
-            for child in children:
-                child_lines = GetPageContentToolHandler._format_block_tree(
-                    child, indent_level + 1, max_depth, db_properties, uuid_map
-                )
-                lines.extend(child_lines)
+            # Queue children if we haven't hit the depth limit. Reversed, so
+            # the first child is popped (and printed) first.
+            children = block.get("children", [])
+            if children and (max_depth == -1 or level < max_depth):
+                stack.extend((child, level + 1) for child in reversed(children))
 
         return lines
 
@@ -318,15 +332,80 @@ class GetPageContentToolHandler(ToolHandler):
             },
         )
 
+    @staticmethod
+    def _page_json(api, result: dict, args: dict) -> dict:
+        """Return the raw page result, enriched with resolved refs in DB mode."""
+        # In DB mode with resolve_refs, enrich JSON with resolved page names
+        if _t._get_db_mode() and args.get("resolve_refs", True):
+            blocks = result.get("blocks", [])
+            page_uuids = _collect_block_uuids(blocks)
+            if page_uuids:
+                try:
+                    uuid_map = api.resolve_page_uuids(list(page_uuids))
+                    if uuid_map:
+                        result = dict(result)
+                        result["resolved_refs"] = uuid_map
+                except Exception as e:
+                    logger.warning(f"Could not resolve refs for JSON: {e}")
+        return result
+
+    @staticmethod
+    def _page_text(api, result: dict, args: dict) -> str:
+        """Format a fetched page as an indented block outline."""
+        content_parts = []
+
+        # Get blocks from the result structure
+        blocks = result.get("blocks", [])
+
+        # Fetch DB-mode class properties (only when LOGSEQ_DB_MODE is enabled)
+        db_properties = {}
+        uuid_map: dict[str, str] = {}
+        if _t._get_db_mode():
+            try:
+                db_properties = api.get_blocks_db_properties(blocks)
+                logger.info(f"DB-mode properties found for {len(db_properties)} blocks")
+            except Exception as e:
+                logger.warning(f"Could not fetch DB-mode properties: {e}")
+
+            # Resolve [[uuid]] page references to readable names
+            resolve_refs = args.get("resolve_refs", True)
+            if resolve_refs:
+                try:
+                    page_uuids = _collect_block_uuids(blocks)
+                    if page_uuids:
+                        uuid_map = api.resolve_page_uuids(list(page_uuids))
+                except Exception as e:
+                    logger.warning(f"Could not resolve page refs: {e}")
+
+        # Blocks content - use recursive formatter
+        max_depth = args.get("max_depth", -1)
+        if blocks:
+            for block in blocks:
+                if isinstance(block, dict):
+                    block_lines = GetPageContentToolHandler._format_block_tree(
+                        block, 0, max_depth, db_properties, uuid_map
+                    )
+                    content_parts.extend(block_lines)
+                elif isinstance(block, str) and block.strip():
+                    content_parts.append(f"- {block}")
+        else:
+            # Empty page - return single dash
+            content_parts.append("-")
+
+        return "\n".join(content_parts)
+
     def _run(self, api, args: dict) -> list[TextContent]:
         """Get and format LogSeq page content."""
         logger.info(f"Getting page content with args: {args}")
 
-        if "page_name" not in args:
-            raise RuntimeError("page_name argument required")
-
         try:
-            result = api.get_page_content(args["page_name"])
+            # The tag check below reads the page's tags, so bypass the read
+            # cache when tag rules are active: a tag added in Logseq moments
+            # ago must already deny the read.
+            result = api.get_page_content(
+                args["page_name"],
+                fresh=bool(access.get_access_config().exclude_tags),
+            )
 
             if not result:
                 return [
@@ -342,67 +421,101 @@ class GetPageContentToolHandler(ToolHandler):
                     f"and cannot be accessed by this assistant."
                 )
 
-            # Handle JSON format request
             if args.get("format") == "json":
-                # In DB mode with resolve_refs, enrich JSON with resolved page names
-                if _t._get_db_mode() and args.get("resolve_refs", True):
-                    blocks = result.get("blocks", [])
-                    page_uuids = _collect_block_uuids(blocks)
-                    if page_uuids:
-                        try:
-                            uuid_map = api.resolve_page_uuids(list(page_uuids))
-                            if uuid_map:
-                                result = dict(result)
-                                result["resolved_refs"] = uuid_map
-                        except Exception as e:
-                            logger.warning(f"Could not resolve refs for JSON: {e}")
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-            # Format as readable text
-            content_parts = []
+                text = _dump_json(self._page_json(api, result, args))
+            else:
+                text = self._page_text(api, result, args)
+            return [TextContent(type="text", text=text)]
 
-            # Get blocks from the result structure
-            blocks = result.get("blocks", [])
+        except Exception as e:
+            logger.error(f"Failed to get page content: {str(e)}")
+            raise
 
-            # Fetch DB-mode class properties (only when LOGSEQ_DB_MODE is enabled)
-            db_properties = {}
-            uuid_map: dict[str, str] = {}
-            if _t._get_db_mode():
-                try:
-                    db_properties = api.get_blocks_db_properties(blocks)
-                    logger.info(f"DB-mode properties found for {len(db_properties)} blocks")
-                except Exception as e:
-                    logger.warning(f"Could not fetch DB-mode properties: {e}")
-
-                # Resolve [[uuid]] page references to readable names
-                resolve_refs = args.get("resolve_refs", True)
-                if resolve_refs:
-                    try:
-                        page_uuids = _collect_block_uuids(blocks)
-                        if page_uuids:
-                            uuid_map = api.resolve_page_uuids(list(page_uuids))
-                    except Exception as e:
-                        logger.warning(f"Could not resolve page refs: {e}")
-
-            # Blocks content - use recursive formatter
-            max_depth = args.get("max_depth", -1)
-            if blocks:
-                for block in blocks:
-                    if isinstance(block, dict):
-                        block_lines = self._format_block_tree(
-                            block, 0, max_depth, db_properties, uuid_map
-                        )
-                        content_parts.extend(block_lines)
-                    elif isinstance(block, str) and block.strip():
-                        content_parts.append(f"- {block}")
-            else:
-                # Empty page - return single dash
-                content_parts.append("-")
 
-            return [TextContent(type="text", text="\n".join(content_parts))]
+class GetPagesContentToolHandler(ToolHandler):
+    """Read several pages in one call, fetching them concurrently."""
+
+    # Every requested name is namespace-gated up front; the tag check on each
+    # fetched page stays inline in _run (it needs the page body).
+    access_policy = [access.NamespaceNames("page_names")]
+
+    def __init__(self):
+        super().__init__("get_pages_content")
+
+    def get_tool_description(self):
+        return Tool(
+            name=self.name,
+            description="Get the content of several pages from LogSeq in one call. Pages are fetched concurrently, so this is faster than repeated get_page_content calls.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "page_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Names of the pages to retrieve",
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Output format (text or json)",
+                        "enum": ["text", "json"],
+                        "default": "text",
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Maximum nesting depth to display (default: -1 for unlimited)",
+                        "default": -1,
+                    },
+                    "resolve_refs": {
+                        "type": "boolean",
+                        "description": "Resolve [[uuid]] page references to [[Page Name]] in DB mode (default: true)",
+                        "default": True,
+                    },
+                },
+                "required": ["page_names"],
+            },
+        )
+
+    def _run(self, api, args: dict) -> list[TextContent]:
+        page_names = args["page_names"]
+
+        try:
+            # Fresh reads under tag rules, as in get_page_content.
+            results = api.get_pages_content(
+                page_names, fresh=bool(access.get_access_config().exclude_tags)
+            )
+
+            # Security: same fail-loud tag/namespace check as get_page_content,
+            # applied to every fetched page before anything is rendered.
+            for page_name, result in zip(page_names, results):
+                if result and _is_page_blocked(result.get("page", {}), page_name):
+                    raise AccessDenied(
+                        f"Access denied: page '{page_name}' is restricted "
+                        f"and cannot be accessed by this assistant."
+                    )
+
+            if args.get("format") == "json":
+                pages = {
+                    page_name: (
+                        GetPageContentToolHandler._page_json(api, result, args)
+                        if result
+                        else None
+                    )
+                    for page_name, result in zip(page_names, results)
+                }
+                return [TextContent(type="text", text=_dump_json(pages))]
+
+            sections = []
+            for page_name, result in zip(page_names, results):
+                if result:
+                    body = GetPageContentToolHandler._page_text(api, result, args)
+                else:
+                    body = f"Page '{page_name}' not found."
+                sections.append(f"# {page_name}\n\n{body}")
+
+            return [TextContent(type="text", text="\n\n".join(sections))]
 
         except Exception as e:
-            logger.error(f"Failed to get page content: {str(e)}")
+            logger.error(f"Failed to get pages content: {str(e)}")
             raise
 
 
@@ -431,29 +544,32 @@ class DeletePageToolHandler(ToolHandler):
             },
         )
 
-    def _run(self, api, args: dict) -> list[TextContent]:
-        if "page_name" not in args:
-            raise RuntimeError("page_name argument required")
-
-        try:
-            result = api.delete_page(args["page_name"])
+    @staticmethod
+    def _delete_page(api, args: dict) -> str:
+        """Delete the page named in ``args``; return the success message.
 
-            # Build detailed success message
-            page_name = args["page_name"]
-            success_msg = f"✅ Successfully deleted page '{page_name}'"
+        Raises on failure. Shared with ``bulk_pages``.
+        """
+        page_name = args["page_name"]
+        result = api.delete_page(page_name)
 
-            # Add any additional info from the API result if available
-            if result and isinstance(result, dict):
-                if result.get("success"):
-                    success_msg += (
-                        f"\n📋 Status: {result.get('message', 'Deletion confirmed')}"
-                    )
+        # Build detailed success message
+        msg_parts = [f"✅ Successfully deleted page '{page_name}'"]
 
-            success_msg += (
-                f"\n🗑️  Page '{page_name}' has been permanently removed from LogSeq"
+        # Add any additional info from the API result if available
+        if result and isinstance(result, dict) and result.get("success"):
+            msg_parts.append(
+                f"📋 Status: {result.get('message', 'Deletion confirmed')}"
             )
 
-            return [TextContent(type="text", text=success_msg)]
+        msg_parts.append(
+            f"🗑️  Page '{page_name}' has been permanently removed from LogSeq"
+        )
+        return "\n".join(msg_parts)
+
+    def _run(self, api, args: dict) -> list[TextContent]:
+        try:
+            return [TextContent(type="text", text=self._delete_page(api, args))]
         except ValueError as e:
             # Handle validation errors (page not found) gracefully
             return [TextContent(type="text", text=f"❌ Error: {str(e)}")]
@@ -522,10 +638,13 @@ YAML frontmatter in content will be merged with explicit properties.""",
             },
         )
 
-    def _run(self, api, args: dict) -> list[TextContent]:
-        if "page_name" not in args:
-            raise RuntimeError("page_name argument required")
+    @staticmethod
+    def _update_page(api, args: dict) -> str:
+        """Apply the update described by ``args``; return the success message.
 
+        Raises ``ValueError`` when there is nothing to update or the page does
+        not exist, and propagates API errors. Shared with ``bulk_pages``.
+        """
         page_name = args["page_name"]
         content = args.get("content", "")
         mode = args.get("mode", "append")
@@ -533,18 +652,13 @@ YAML frontmatter in content will be merged with explicit properties.""",
 
         # Validate that at least one update is provided
         if not content and not explicit_properties:
-            return [
-                TextContent(
-                    type="text",
-                    text="Error: Either 'content' or 'properties' must be provided for update",
-                )
-            ]
+            raise ValueError(
+                "Either 'content' or 'properties' must be provided for update"
+            )
 
-        try:
+        if content:
             # Parse the content
-            parsed = (
-                parser.parse_content(content) if content else parser.ParsedContent()
-            )
+            parsed = parser.parse_content(content)
 
             # Merge properties: explicit properties override frontmatter
             page_properties = (
@@ -555,29 +669,38 @@ YAML frontmatter in content will be merged with explicit properties.""",
 
             # Convert blocks to batch format
             blocks = parsed.to_batch_format()
+        else:
+            # Properties-only update: nothing to parse
+            page_properties = explicit_properties
+            blocks = []
 
-            # Update the page
-            result = api.update_page_with_blocks(
-                page_name, blocks, page_properties, mode=mode
-            )
+        # Update the page
+        result = api.update_page_with_blocks(
+            page_name, blocks, page_properties, mode=mode
+        )
 
-            # Build success message
-            updates = result.get("updates", [])
-            msg_parts = [f"Successfully updated page '{page_name}'"]
+        # Build success message
+        updates = result.get("updates", [])
+        msg_parts = [f"Successfully updated page '{page_name}'"]
 
-            for update_type, update_value in updates:
-                if update_type == "cleared":
-                    msg_parts.append("  - Existing content cleared")
-                elif update_type == "properties":
-                    msg_parts.append(f"  - {len(update_value)} property/ies updated")
-                elif update_type == "blocks_replaced":
-                    msg_parts.append(f"  - {update_value} block(s) added")
-                elif update_type == "blocks_appended":
-                    msg_parts.append(f"  - {update_value} block(s) appended")
+        for update_type, update_value in updates:
+            if update_type == "cleared":
+                msg_parts.append("  - Existing content cleared")
+            elif update_type == "properties":
+                msg_parts.append(f"  - {len(update_value)} property/ies updated")
+            elif update_type == "blocks_replaced":
+                msg_parts.append(f"  - {update_value} block(s) added")
+            elif update_type == "blocks_appended":
+                msg_parts.append(f"  - {update_value} block(s) appended")
 
-            msg_parts.append(f"Mode: {mode}")
+        msg_parts.append(f"Mode: {mode}")
 
-            return [TextContent(type="text", text="\n".join(msg_parts))]
+        return "\n".join(msg_parts)
+
+    def _run(self, api, args: dict) -> list[TextContent]:
+        page_name = args["page_name"]
+        try:
+            return [TextContent(type="text", text=self._update_page(api, args))]
         except ValueError as e:
             return [TextContent(type="text", text=f"Error: {str(e)}")]
         except Exception as e:
@@ -589,6 +712,147 @@ YAML frontmatter in content will be merged with explicit properties.""",
             ]
 
 
+class BulkPagesToolHandler(ToolHandler):
+    """
+    Apply several page creates, updates and deletes in one tool call.
+
+    Each operation goes through the same code path and access policy as the
+    matching single-page tool. Operations run in order, and one failing does
+    not stop the rest; the result reports every operation's outcome.
+    """
+
+    # No batch-level gate: each operation is checked against the declared
+    # access_policy of its single-page handler (see _OPS) before it runs.
+    access_policy = []
+
+    # op -> (single-page handler, name of its page argument)
+    _OPS = {
+        "create": (CreatePageToolHandler, "title"),
+        "update": (UpdatePageToolHandler, "page_name"),
+        "delete": (DeletePageToolHandler, "page_name"),
+    }
+
+    def __init__(self):
+        super().__init__("bulk_pages")
+
+    def get_tool_description(self):
+        return Tool(
+            name=self.name,
+            description="""Create, update and delete several pages in one call.
+
+Each operation behaves exactly like create_page, update_page or delete_page.
+Operations run in the order given; a failed operation is reported and the
+remaining ones still run.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "description": "Page operations to apply, in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "op": {
+                                    "type": "string",
+                                    "enum": ["create", "update", "delete"],
+                                },
+                                "page_name": {
+                                    "type": "string",
+                                    "description": "Page to create, update or delete",
+                                },
+                                "content": {
+                                    "type": "string",
+                                    "description": "Markdown content (create/update)",
+                                },
+                                "properties": {
+                                    "type": "object",
+                                    "description": "Page properties (create/update)",
+                                    "additionalProperties": True,
+                                },
+                                "mode": {
+                                    "type": "string",
+                                    "enum": ["append", "replace"],
+                                    "default": "append",
+                                    "description": "Update mode (update only)",
+                                },
+                            },
+                            "required": ["op", "page_name"],
+                        },
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Output format (text or json)",
+                        "enum": ["text", "json"],
+                        "default": "text",
+                    },
+                },
+                "required": ["operations"],
+            },
+        )
+
+    @classmethod
+    def _apply(cls, api, operation: dict) -> str:
+        """Run one operation through its single-page handler; return its message."""
+        if not isinstance(operation, dict):
+            raise ValueError("Operation must be an object")
+        op = operation.get("op")
+        if op not in cls._OPS:
+            raise ValueError(f"Unknown operation '{op}'")
+        page_name = operation.get("page_name")
+        if not page_name:
+            raise ValueError("page_name argument required")
+
+        handler_cls, name_arg = cls._OPS[op]
+        args = {k: v for k, v in operation.items() if k not in ("op", "page_name")}
+        args[name_arg] = page_name
+        for policy in handler_cls.access_policy:
+            policy.enforce(api, args)
+
+        if op == "create":
+            return handler_cls._create_page(api, args)
+        if op == "update":
+            return handler_cls._update_page(api, args)
+        return handler_cls._delete_page(api, args)
+
+    def _run(self, api, args: dict) -> list[TextContent]:
+        operations = args["operations"]
+        if not isinstance(operations, list):
+            raise RuntimeError("operations must be a list")
+
+        results = []
+        for operation in operations:
+            # A malformed item fails on its own in _apply, like any other bad
+            # operation; it is reported without an op or page name.
+            fields = operation if isinstance(operation, dict) else {}
+            entry = {"op": fields.get("op"), "page_name": fields.get("page_name")}
+            try:
+                entry["message"] = self._apply(api, operation)
+                entry["ok"] = True
+            except Exception as e:
+                logger.error(f"Bulk {entry['op']} of '{entry['page_name']}' failed: {str(e)}")
+                entry["error"] = str(e)
+                entry["ok"] = False
+            results.append(entry)
+
+        succeeded = sum(1 for r in results if r["ok"])
+        failed = len(results) - succeeded
+
+        if args.get("format") == "json":
+            text = _dump_json(
+                {"succeeded": succeeded, "failed": failed, "results": results}
+            )
+            return [TextContent(type="text", text=text)]
+
+        lines = [f"Bulk page operations: {succeeded} succeeded, {failed} failed", ""]
+        for i, r in enumerate(results, 1):
+            if r["ok"]:
+                lines.append(f"{i}. ✅ {r['op']} '{r['page_name']}'")
+                lines.extend(f"   {line}" for line in r["message"].splitlines())
+            else:
+                lines.append(f"{i}. ❌ {r['op']} '{r['page_name']}': {r['error']}")
+        return [TextContent(type="text", text="\n".join(lines))]
+
+
 class FindPagesByPropertyToolHandler(ToolHandler):
     """Find pages by property name and optional value."""
 
@@ -623,22 +887,22 @@ class FindPagesByPropertyToolHandler(ToolHandler):
             }
         )
 
-    def _escape_value(self, value: str) -> str:
-        """Escape special characters in property values for DSL query."""
-        return value.replace('"', '\\"')
+    def _quote_value(self, value: str) -> str:
+        """Quote a property value as a DSL string literal.
+
+        json.dumps escapes backslashes and control characters as well as
+        quotes, using the same escapes the DSL's string reader accepts.
+        """
+        return json.dumps(value, ensure_ascii=False)
 
     def _validate_property_name(self, name: str) -> str:
         """Validate and return property name, raising if it contains unsafe characters."""
-        import re
-        if not re.match(r'^[a-zA-Z0-9_\-]+$', name):
+        if not _PROPERTY_NAME_PATTERN.match(name):
             raise ValueError(f"Invalid property name '{name}': only alphanumeric, hyphens, and underscores allowed")
         return name
 
     def _run(self, api, args: dict) -> list[TextContent]:
         """Find pages by property and format results."""
-        if "property_name" not in args:
-            raise RuntimeError("property_name argument required")
-
         try:
             property_name = self._validate_property_name(args["property_name"])
         except ValueError as e:
@@ -648,8 +912,7 @@ class FindPagesByPropertyToolHandler(ToolHandler):
 
         # Build the DSL query
         if property_value:
-            escaped_value = self._escape_value(property_value)
-            query = f'(page-property {property_name} "{escaped_value}")'
+            query = f'(page-property {property_name} {self._quote_value(property_value)})'
         else:
             query = f'(page-property {property_name})'
 
@@ -685,16 +948,18 @@ class FindPagesByPropertyToolHandler(ToolHandler):
             else:
                 content_parts.append(f"# Pages with property '{property_name}'\n")
 
+            # Show the property value if we searched without a specific value,
+            # under the name as given or its lowercased form (loop-invariant).
+            value_keys = () if property_value else (property_name, property_name.lower())
+
             for item in limited_results:
                 if isinstance(item, dict):
                     name = item.get("originalName") or item.get("name", "<unknown>")
                     props = item.get("propertiesTextValues", {}) or item.get("properties", {})
 
-                    # Show the property value if we searched without a specific value
-                    if not property_value and property_name in props:
-                        content_parts.append(f"- **{name}** ({property_name}: {props[property_name]})")
-                    elif not property_value and property_name.lower() in props:
-                        content_parts.append(f"- **{name}** ({property_name}: {props[property_name.lower()]})")
+                    key = next((k for k in value_keys if k in props), None)
+                    if key is not None:
+                        content_parts.append(f"- **{name}** ({property_name}: {props[key]})")
                     else:
                         content_parts.append(f"- **{name}**")
                 else:
@@ -750,9 +1015,6 @@ class RenamePageToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "old_name" not in args or "new_name" not in args:
-            raise RuntimeError("old_name and new_name arguments required")
-
         old_name = args["old_name"]
         new_name = args["new_name"]
 
@@ -806,9 +1068,6 @@ class GetPageBacklinksToolHandler(ToolHandler):
         )
 
     def _run(self, api, args: dict) -> list[TextContent]:
-        if "page_name" not in args:
-            raise RuntimeError("page_name argument required")
-
         page_name = args["page_name"]
         include_content = args.get("include_content", True)
 
@@ -859,10 +1118,7 @@ class GetPageBacklinksToolHandler(ToolHandler):
                     for block in blocks:
                         block_content = block.get('content', '').strip()
                         if block_content:
-                            # Truncate long content
-                            if len(block_content) > 150:
-                                block_content = block_content[:150] + "..."
-                            content_parts.append(f"  - {block_content}")
+                            content_parts.append(f"  - {_truncate(block_content, 150)}")
 
                 content_parts.append("")
 
@@ -1,6 +1,6 @@
 """Search and DSL/datascript query tool handlers."""
 
-import json
+import re
 
 from mcp.types import Tool, TextContent
 
@@ -11,7 +11,17 @@ from ..access import (
     is_page_blocked as _is_page_blocked,
 )
 from ..namespace import is_namespace_blocked as _is_namespace_blocked
-from .base import ToolHandler, logger, _UUID_REF_PATTERN
+from .base import ToolHandler, logger, _UUID_REF_PATTERN, _dump_json, _truncate
+
+# Full-text search highlight markers Logseq wraps around matched terms.
+_PFTS_MARKER_PATTERN = re.compile(r"\$pfts_2lqh>\$|\$<pfts_2lqh\$")
+
+
+def _found_label(found: int, shown: int) -> str:
+    """Section count label; says how many are listed when ``limit`` cut it short."""
+    if shown < found:
+        return f"{found} found, showing {shown}"
+    return f"{found} found"
 
 
 class SearchToolHandler(ToolHandler):
@@ -70,7 +80,9 @@ class SearchToolHandler(ToolHandler):
     ) -> set[str]:
         """Return lowercased names of pages blocked by tag or namespace rules.
 
-        Makes one extra api.list_pages() call when any rule is configured.
+        Makes one extra api.list_pages() call when any rule is configured,
+        bypassing the read cache: search results are live, so the exclusion
+        set must be too (a page tagged moments ago must already be hidden).
         Fail-closed: when rules are active but the page list cannot be built,
         the error propagates so the caller aborts rather than returning an empty
         (degraded) exclusion set that would let restricted content through.
@@ -78,7 +90,7 @@ class SearchToolHandler(ToolHandler):
         if not exclude_tags and not exclude_namespaces and not include_namespaces:
             return set()
         try:
-            pages = api.list_pages()
+            pages = api.list_pages(fresh=True)
             blocked = set()
             for page in pages:
                 name = page.get("originalName") or page.get("name", "")
@@ -152,7 +164,10 @@ class SearchToolHandler(ToolHandler):
         distinguished by the 'page?' flag.
         """
         parts: list[str] = []
-        blocks = result.get("blocks", [])
+
+        # Read each category once; "or []" also covers keys Logseq sends as null.
+        blocks = result.get("blocks") or []
+        files = result.get("files") or []
 
         # Split into pages and content blocks
         page_results = [b for b in blocks if b.get("page?")]
@@ -175,30 +190,31 @@ class SearchToolHandler(ToolHandler):
                 parts.append("")
 
         if include_blocks and block_results:
-            parts.append(f"## Content Blocks ({len(block_results)} found)")
-            for i, block in enumerate(block_results[:limit]):
+            shown = block_results[:limit]
+            parts.append(
+                f"## Content Blocks ({_found_label(len(block_results), len(shown))})"
+            )
+            for i, block in enumerate(shown):
                 content = block.get("content", "").strip()
                 # Clean up full-text search highlight markers
-                content = content.replace("$pfts_2lqh>$", "").replace("$<pfts_2lqh$", "")
+                content = _PFTS_MARKER_PATTERN.sub("", content)
                 if content:
                     page_id = block.get("page", "")
                     uuid = block.get("uuid", "")
-                    if len(content) > 150:
-                        content = content[:150] + "..."
-                    parts.append(f"{i + 1}. {content}")
+                    parts.append(f"{i + 1}. {_truncate(content, 150)}")
                     parts.append(f"   uuid: {uuid}  page: {page_id}")
             parts.append("")
 
-        if include_files and result.get("files"):
-            parts.append(f"## Matching Files ({len(result['files'])} found)")
-            for f in result["files"]:
+        if include_files and files:
+            parts.append(f"## Matching Files ({len(files)} found)")
+            for f in files:
                 parts.append(f"- {f}")
             parts.append("")
 
         if result.get("hasMore?"):
             parts.append("*More results available — increase limit to see more*")
 
-        total = len(blocks) + len(result.get("files", []))
+        total = len(blocks) + len(files)
         parts.append(f"\n**Total results found: {total}**")
         return parts
 
@@ -216,39 +232,40 @@ class SearchToolHandler(ToolHandler):
         """
         parts: list[str] = []
 
-        if include_blocks and result.get("blocks") and not excluded_page_names:
+        # Read each category once; "or []" also covers keys Logseq sends as null.
+        blocks = result.get("blocks") or []
+        snippets = result.get("pages-content") or []
+        pages = result.get("pages") or []
+        files = result.get("files") or []
+
+        if include_blocks and blocks and not excluded_page_names:
             # Only show blocks when no exclusion is active — markdown-mode blocks
             # carry block/content but no page identifier, so we cannot verify they
             # are safe to show (same rule as the page-snippets section below)
-            blocks = result["blocks"]
-            parts.append(f"## Content Blocks ({len(blocks)} found)")
-            for i, block in enumerate(blocks[:limit]):
+            shown = blocks[:limit]
+            parts.append(f"## Content Blocks ({_found_label(len(blocks), len(shown))})")
+            for i, block in enumerate(shown):
                 content = block.get("block/content", "").strip()
                 if content:
-                    if len(content) > 150:
-                        content = content[:150] + "..."
-                    parts.append(f"{i + 1}. {content}")
+                    parts.append(f"{i + 1}. {_truncate(content, 150)}")
             parts.append("")
 
-        if include_pages and result.get("pages-content"):
-            snippets = result["pages-content"]
+        if include_pages and snippets:
             if not excluded_page_names:
                 # Only show snippets when no exclusion is active — snippets carry no
                 # page identifier so we cannot verify they are safe to show
-                parts.append(f"## Page Snippets ({len(snippets)} found)")
-                for i, snippet in enumerate(snippets[:limit]):
+                shown = snippets[:limit]
+                parts.append(
+                    f"## Page Snippets ({_found_label(len(snippets), len(shown))})"
+                )
+                for i, snippet in enumerate(shown):
                     snippet_text = snippet.get("block/snippet", "").strip()
                     if snippet_text:
-                        snippet_text = snippet_text.replace("$pfts_2lqh>$", "").replace(
-                            "$<pfts_2lqh$", ""
-                        )
-                        if len(snippet_text) > 200:
-                            snippet_text = snippet_text[:200] + "..."
-                        parts.append(f"{i + 1}. {snippet_text}")
+                        snippet_text = _PFTS_MARKER_PATTERN.sub("", snippet_text)
+                        parts.append(f"{i + 1}. {_truncate(snippet_text, 200)}")
                 parts.append("")
 
-        if include_pages and result.get("pages"):
-            pages = result["pages"]
+        if include_pages and pages:
             visible_pages = [p for p in pages if p.lower() not in excluded_page_names]
             if visible_pages:
                 parts.append(f"## Matching Pages ({len(visible_pages)} found)")
@@ -256,8 +273,7 @@ class SearchToolHandler(ToolHandler):
                     parts.append(f"- {page}")
                 parts.append("")
 
-        if include_files and result.get("files"):
-            files = result["files"]
+        if include_files and files:
             parts.append(f"## Matching Files ({len(files)} found)")
             for f in files:
                 parts.append(f"- {f}")
@@ -266,12 +282,7 @@ class SearchToolHandler(ToolHandler):
         if result.get("has-more?"):
             parts.append("*More results available — increase limit to see more*")
 
-        total = (
-            len(result.get("blocks", []))
-            + len(result.get("pages", []))
-            + len(result.get("pages-content", []))
-            + len(result.get("files", []))
-        )
+        total = len(blocks) + len(pages) + len(snippets) + len(files)
         parts.append(f"\n**Total results found: {total}**")
         return parts
 
@@ -290,8 +301,11 @@ class SearchToolHandler(ToolHandler):
         """
         out: dict = {"query": query, "mode": "db" if _t._get_db_mode() else "markdown"}
 
+        # "or []" also covers categories Logseq sends as null.
+        blocks = result.get("blocks") or []
+        files = result.get("files") or []
+
         if _t._get_db_mode():
-            blocks = result.get("blocks", [])
             if include_pages:
                 out["pages"] = [
                     p for p in blocks
@@ -308,32 +322,30 @@ class SearchToolHandler(ToolHandler):
                 for block in visible_blocks[:limit]:
                     block = dict(block)
                     content = block.get("content", "")
-                    block["content"] = content.replace("$pfts_2lqh>$", "").replace(
-                        "$<pfts_2lqh$", ""
-                    )
+                    block["content"] = _PFTS_MARKER_PATTERN.sub("", content)
                     block_results.append(block)
                 out["blocks"] = block_results
             if include_files:
-                out["files"] = result.get("files", [])
+                out["files"] = files
             out["has_more"] = bool(result.get("hasMore?"))
         else:
             if include_blocks and not excluded_page_names:
                 # Markdown-mode blocks carry block/content but no page
                 # identifier, so they cannot be exclusion-filtered — only expose
                 # them when no exclusion is active (same rule as snippets)
-                out["blocks"] = result.get("blocks", [])[:limit]
+                out["blocks"] = blocks[:limit]
             if include_pages:
                 out["pages"] = [
-                    p for p in result.get("pages", [])
+                    p for p in result.get("pages") or []
                     if p.lower() not in excluded_page_names
                 ]
                 if not excluded_page_names:
                     # Snippets carry no page identifier, so they cannot be
                     # exclusion-filtered — only expose them when no exclusion
                     # is active (same rule as text mode)
-                    out["pages_content"] = result.get("pages-content", [])[:limit]
+                    out["pages_content"] = (result.get("pages-content") or [])[:limit]
             if include_files:
-                out["files"] = result.get("files", [])
+                out["files"] = files
             out["has_more"] = bool(result.get("has-more?"))
 
         return out
@@ -342,9 +354,6 @@ class SearchToolHandler(ToolHandler):
         """Execute search and format results."""
         logger.info(f"Searching with args: {args}")
 
-        if "query" not in args:
-            raise RuntimeError("query argument required")
-
         query = args["query"]
         limit = args.get("limit", 20)
         include_blocks = args.get("include_blocks", True)
@@ -374,7 +383,7 @@ class SearchToolHandler(ToolHandler):
                 json_result = self._build_json_results(
                     result, query, limit, include_blocks, include_pages, include_files, excluded_page_names, api
                 )
-                return [TextContent(type="text", text=json.dumps(json_result, indent=2))]
+                return [TextContent(type="text", text=_dump_json(json_result))]
 
             # Format results
             content_parts = []
@@ -444,20 +453,22 @@ class QueryToolHandler(ToolHandler):
             }
         )
 
-    def _is_page(self, item: dict) -> bool:
-        """Detect if a result item is a page based on available fields."""
-        if not isinstance(item, dict):
-            return False
-        # Pages typically have originalName or name without block-specific fields
-        has_page_fields = bool(item.get("originalName") or item.get("name"))
-        has_block_content = bool(item.get("content") or item.get("block/content"))
-        return has_page_fields and not has_block_content
-
-    def _is_block(self, item: dict) -> bool:
-        """Detect if a result item is a block based on available fields."""
+    @staticmethod
+    def _item_kind(item) -> str:
+        """Classify a result item as "page", "block" or "other".
+
+        Computed once per item and reused by the result_type filter, the
+        access filter and the formatter.
+        """
         if not isinstance(item, dict):
-            return False
-        return bool(item.get("content") or item.get("block/content"))
+            return "other"
+        # Anything with block content is a block; pages typically have
+        # originalName or name without block-specific fields.
+        if item.get("content") or item.get("block/content"):
+            return "block"
+        if item.get("originalName") or item.get("name"):
+            return "page"
+        return "other"
 
     @staticmethod
     def _block_page_name(item: dict, api) -> str | None:
@@ -513,21 +524,22 @@ class QueryToolHandler(ToolHandler):
             return True
         if acl.exclude_tags:
             # Tag exclusion needs the page's properties; fetch the owning page
-            # and inspect its tags. Fail-closed if it cannot be fetched.
+            # fresh (query results are live) and inspect its tags. Fail-closed
+            # if it cannot be fetched.
             try:
-                page = api.get_page_content(page_name)
+                page = api.get_page_content(page_name, fresh=True)
             except Exception:
                 return True
             if page and _is_page_excluded(page.get("page", {}), acl.exclude_tags):
                 return True
         return False
 
-    def _format_item(self, item: dict, index: int) -> str:
+    def _format_item(self, item: dict, index: int, kind: str) -> str:
         """Format a single result item with type indicator."""
         if not isinstance(item, dict):
             return f"{index}. {item}"
 
-        if self._is_page(item):
+        if kind == "page":
             name = item.get("originalName") or item.get("name", "<unknown>")
             # Get properties if available
             props = item.get("propertiesTextValues", {}) or item.get("properties", {})
@@ -535,12 +547,9 @@ class QueryToolHandler(ToolHandler):
             if props_str:
                 return f"{index}. 📄 **{name}** ({props_str})"
             return f"{index}. 📄 **{name}**"
-        elif self._is_block(item):
+        elif kind == "block":
             content = item.get("content") or item.get("block/content", "")
-            # Truncate long content
-            if len(content) > 100:
-                content = content[:100] + "..."
-            return f"{index}. 📝 {content}"
+            return f"{index}. 📝 {_truncate(content, 100)}"
         else:
             # Unknown type - just show what we have
             name = item.get("originalName") or item.get("name") or str(item)[:50]
@@ -548,9 +557,6 @@ class QueryToolHandler(ToolHandler):
 
     def _run(self, api, args: dict) -> list[TextContent]:
         """Execute DSL query and format results."""
-        if "query" not in args:
-            raise RuntimeError("query argument required")
-
         query = args["query"]
         limit = args.get("limit", 100)
         result_type = args.get("result_type", "all")
@@ -564,14 +570,14 @@ class QueryToolHandler(ToolHandler):
                     text=f"No results found for query: `{query}`"
                 )]
 
-            # Filter by result_type if specified
-            filtered_results = []
-            for item in result:
-                if result_type == "pages_only" and not self._is_page(item):
-                    continue
-                if result_type == "blocks_only" and not self._is_block(item):
-                    continue
-                filtered_results.append(item)
+            # Classify each item once, then filter by result_type if specified
+            wanted = {"pages_only": "page", "blocks_only": "block"}.get(result_type)
+            filtered_results = [
+                (kind, item)
+                for item in result
+                for kind in (self._item_kind(item),)
+                if wanted is None or kind == wanted
+            ]
 
             # Security: filter page objects blocked by tag OR namespace, AND
             # block objects whose owning page is blocked by tag OR namespace.
@@ -584,15 +590,15 @@ class QueryToolHandler(ToolHandler):
                 # Per-request memo so blocks sharing an owning page only trigger
                 # one tag/namespace resolution + fetch.
                 block_decision_cache: dict[str, bool] = {}
-                for item in filtered_results:
-                    if self._is_page(item):
+                for kind, item in filtered_results:
+                    if kind == "page":
                         name = item.get("originalName") or item.get("name", "")
                         if _is_page_blocked(item, name):
                             continue
-                    elif self._is_block(item):
+                    elif kind == "block":
                         if self._block_blocked(item, api, block_decision_cache):
                             continue
-                    filtered.append(item)
+                    filtered.append((kind, item))
                 filtered_results = filtered
 
             if not filtered_results:
@@ -609,17 +615,17 @@ class QueryToolHandler(ToolHandler):
                 json_result = {
                     "query": query,
                     "total": len(filtered_results),
-                    "results": limited_results,
+                    "results": [item for _, item in limited_results],
                 }
-                return [TextContent(type="text", text=json.dumps(json_result, indent=2))]
+                return [TextContent(type="text", text=_dump_json(json_result))]
 
             # Format results
             content_parts = []
             content_parts.append(f"# Query Results\n")
             content_parts.append(f"**Query:** `{query}`\n")
 
-            for i, item in enumerate(limited_results, 1):
-                content_parts.append(self._format_item(item, i))
+            for i, (kind, item) in enumerate(limited_results, 1):
+                content_parts.append(self._format_item(item, i, kind))
 
             # Summary
             content_parts.append(f"\n---")
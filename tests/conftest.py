@@ -324,11 +324,15 @@ def _fresh_settings(monkeypatch):
 
     Settings are resolved lazily via ``get_settings()`` (cached per process);
     clearing the cache around each test keeps env patches effective and
-    prevents settings state from leaking between tests.
+    prevents settings state from leaking between tests. The shared API client
+    built from those settings is dropped alongside them.
     """
     from mcp_logseq import settings
+    from mcp_logseq.tools import base
 
     monkeypatch.setenv("LOGSEQ_API_TOKEN", "test_api_key_12345")
     settings.get_settings.cache_clear()
+    base._client_for.cache_clear()
     yield
     settings.get_settings.cache_clear()
+    base._client_for.cache_clear()
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import threading
 from unittest.mock import patch, Mock, AsyncMock
 from mcp.types import Tool, TextContent
 from mcp_logseq.server import app, tool_handlers, add_tool_handler, get_tool_handler
@@ -49,17 +50,17 @@ class TestMCPServerIntegration:
 
     def test_list_tools_handler_count(self):
         """Test that we have the expected number of tool handlers."""
-        # We should have 17 registered tool handlers
-        assert len(tool_handlers) == 17
+        # We should have 19 registered tool handlers
+        assert len(tool_handlers) == 19
 
         # Verify core tool names are present
         core_tools = [
-            "create_page", "list_pages", "get_page_content",
+            "create_page", "list_pages", "get_page_content", "get_pages_content",
             "delete_page", "delete_block", "update_block", "update_page",
             "search", "query", "find_pages_by_property",
             "get_pages_from_namespace", "get_pages_tree_from_namespace",
             "rename_page", "get_page_backlinks",
-            "insert_nested_block", "set_block_properties",
+            "insert_nested_block", "set_block_properties", "bulk_pages",
         ]
         for name in core_tools:
             assert name in tool_handlers
@@ -260,6 +261,65 @@ class TestMCPServerIntegration:
         # Clean up
         del tool_handlers["custom_tool"]
 
+    def test_concurrent_tool_calls_overlap(self):
+        """Synchronous handlers run off the event loop, so calls overlap.
+
+        Each call blocks on a two-party barrier: it only completes if both
+        calls are in flight at once, i.e. call_tool does not serialize them.
+        """
+        from mcp.types import CallToolRequest, CallToolRequestParams
+        from mcp_logseq.server import build_app
+        from mcp_logseq.tools import ToolHandler
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierToolHandler(ToolHandler):
+            def __init__(self):
+                super().__init__("barrier_tool")
+
+            def get_tool_description(self):
+                return Tool(
+                    name=self.name,
+                    description="Waits for a concurrent call",
+                    inputSchema={"type": "object", "properties": {}},
+                )
+
+            def run_tool(self, args: dict):
+                barrier.wait()
+                return [TextContent(type="text", text="done")]
+
+        server, handlers = build_app()
+        handlers["barrier_tool"] = BarrierToolHandler()
+        call_tool = server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="barrier_tool", arguments={}),
+        )
+
+        async def call_twice():
+            return await asyncio.gather(call_tool(request), call_tool(request))
+
+        results = asyncio.run(call_twice())
+
+        for result in results:
+            assert result.root.isError is False
+            assert result.root.content[0].text == "done"
+
+    def test_list_tools_reuses_tool_descriptions(self):
+        """Repeat tools/list requests return the same prebuilt Tool objects."""
+        from mcp.types import ListToolsRequest
+        from mcp_logseq.server import build_app
+
+        server, _ = build_app()
+        list_tools = server.request_handlers[ListToolsRequest]
+        request = ListToolsRequest(method="tools/list")
+
+        first = asyncio.run(list_tools(request)).root.tools
+        second = asyncio.run(list_tools(request)).root.tools
+
+        assert len(first) == len(second) > 0
+        assert all(a is b for a, b in zip(first, second))
+
     def test_tool_handler_interface_compliance(self):
         """Test that all registered tool handlers implement the required interface."""
         for name, handler in tool_handlers.items():
@@ -25,6 +25,7 @@ EXPECTED_POLICIES = {
     # Page handlers -----------------------------------------------------------
     tools.CreatePageToolHandler: {(access.NamespaceName, "title")},
     tools.GetPageContentToolHandler: {(access.NamespaceName, "page_name")},
+    tools.GetPagesContentToolHandler: {(access.NamespaceNames, "page_names")},
     tools.DeletePageToolHandler: {
         (access.NamespaceName, "page_name"),
         (access.PageTag, "page_name"),
@@ -39,6 +40,8 @@ EXPECTED_POLICIES = {
         (access.PageTag, "old_name"),
     },
     tools.GetPageBacklinksToolHandler: {(access.NamespaceName, "page_name")},
+    # Checked per operation against the single-page handler's own policy.
+    tools.BulkPagesToolHandler: set(),
     # Block handlers (identical namespace + tag pair on the uuid argument) -----
     tools.DeleteBlockToolHandler: {
         (access.BlockNamespace, "block_uuid"),
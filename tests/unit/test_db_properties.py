@@ -403,6 +403,27 @@ class TestFeatureFlagIntegration:
         assert "LOGSEQ_DB_MODE=true" in result[0].text
         assert len(responses.calls) == 0  # No API calls made
 
+    def test_set_block_properties_mode_error_precedes_missing_args(self):
+        """Without DB mode, missing arguments still get the DB-mode error."""
+        from mcp_logseq.tools import SetBlockPropertiesToolHandler
+
+        handler = SetBlockPropertiesToolHandler()
+
+        with patch("mcp_logseq.tools._get_db_mode", return_value=False):
+            result = handler.run_tool({})
+
+        assert "LOGSEQ_DB_MODE=true" in result[0].text
+
+    def test_set_block_properties_missing_args_in_db_mode(self):
+        """In DB mode, missing arguments are rejected before any API call."""
+        from mcp_logseq.tools import SetBlockPropertiesToolHandler
+
+        handler = SetBlockPropertiesToolHandler()
+
+        with patch("mcp_logseq.tools._get_db_mode", return_value=True), \
+                pytest.raises(RuntimeError, match="block_uuid and properties"):
+            handler.run_tool({"block_uuid": "test-uuid"})
+
 
 class TestUuidRefResolution:
     """Tests for resolving [[uuid]] page references to [[Page Name]]."""
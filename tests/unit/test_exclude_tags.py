@@ -15,16 +15,49 @@ from unittest.mock import patch, Mock
 
 from mcp_logseq.config import load_exclude_tags
 from mcp_logseq.access import AccessConfig
+from mcp_logseq.logseq import LogSeq
 from mcp_logseq.tools import (
     _extract_tags,
     _is_page_excluded,
     ListPagesToolHandler,
     GetPageContentToolHandler,
+    GetPagesContentToolHandler,
     SearchToolHandler,
     QueryToolHandler,
 )
 
 
+def _cached_client(fetch_all_pages):
+    """A real caching client whose page-list fetches return each given list in turn.
+
+    The first list is fetched (and cached) right away, standing in for an
+    earlier read in the same session.
+    """
+    client = LogSeq(api_key="test_token", cache_ttl=30)
+    client._fetch_all_pages = Mock(side_effect=fetch_all_pages)
+    client.list_pages()
+    return client
+
+
+def _cached_page_client(untagged_props, tagged_props):
+    """A real caching client holding an untagged copy of page "Diary",
+    while Logseq itself now has the page tagged."""
+    client = LogSeq(api_key="test_token", cache_ttl=30)
+    client._fetch_page_content = Mock(side_effect=[
+        {"page": {"originalName": "Diary", "properties": props},
+         "blocks": [{"content": "dear diary", "children": []}]}
+        for props in (untagged_props, tagged_props)
+    ])
+    client.get_page_content("Diary")
+    return client
+
+
+_UNTAGGED = [{"originalName": "Diary", "journal?": False, "properties": {}}]
+_TAGGED = [
+    {"originalName": "Diary", "journal?": False, "properties": {"tags": ["private"]}}
+]
+
+
 def _exclude_tags_patch(tags):
     """Patch the cached ACL config with the given exclude tags."""
     return patch(
@@ -223,6 +256,19 @@ def test_list_pages_multiple_excluded_tags(mock_logseq_class):
     assert "Draft" not in text
 
 
+@patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+@patch("mcp_logseq.tools.logseq.LogSeq")
+def test_list_pages_hides_page_tagged_after_list_was_cached(mock_logseq_class):
+    """With rules active the list is re-read, so a cached copy cannot leak."""
+    mock_logseq_class.return_value = _cached_client([_UNTAGGED, _TAGGED])
+
+    handler = ListPagesToolHandler()
+    with _exclude_tags_patch(["private"]):
+        result = handler.run_tool({})
+
+    assert "Diary" not in result[0].text
+
+
 # =============================================================================
 # GetPageContentToolHandler
 # =============================================================================
@@ -278,6 +324,28 @@ def test_get_page_content_no_block_when_exclude_empty(mock_logseq_class):
     assert "private content" in result[0].text
 
 
+@patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+@patch("mcp_logseq.tools.logseq.LogSeq")
+def test_get_page_content_denies_page_tagged_after_it_was_cached(mock_logseq_class):
+    mock_logseq_class.return_value = _cached_page_client({}, {"tags": ["private"]})
+
+    handler = GetPageContentToolHandler()
+    with _exclude_tags_patch(["private"]):
+        with pytest.raises(RuntimeError, match="Access denied"):
+            handler.run_tool({"page_name": "Diary"})
+
+
+@patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+@patch("mcp_logseq.tools.logseq.LogSeq")
+def test_get_pages_content_denies_page_tagged_after_it_was_cached(mock_logseq_class):
+    mock_logseq_class.return_value = _cached_page_client({}, {"tags": ["private"]})
+
+    handler = GetPagesContentToolHandler()
+    with _exclude_tags_patch(["private"]):
+        with pytest.raises(RuntimeError, match="Access denied"):
+            handler.run_tool({"page_names": ["Diary"]})
+
+
 # =============================================================================
 # SearchToolHandler
 # =============================================================================
@@ -308,6 +376,28 @@ def test_search_filters_excluded_page_names(mock_logseq_class):
     assert "Secret Page" not in text
 
 
+@patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+@patch("mcp_logseq.tools.logseq.LogSeq")
+def test_search_hides_page_tagged_after_list_was_cached(mock_logseq_class):
+    """Search results are live, so the exclusion set is built from a fresh list."""
+    client = _cached_client([_UNTAGGED, _TAGGED])
+    client.search_content = Mock(return_value={
+        "blocks": [],
+        "pages": ["Diary"],
+        "pages-content": [{"block/snippet": "dear diary"}],
+        "files": [],
+    })
+    mock_logseq_class.return_value = client
+
+    handler = SearchToolHandler()
+    with _exclude_tags_patch(["private"]):
+        result = handler.run_tool({"query": "diary"})
+
+    text = result[0].text
+    assert "Diary" not in text
+    assert "dear diary" not in text
+
+
 @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
 @patch("mcp_logseq.tools.logseq.LogSeq")
 def test_search_no_extra_api_call_when_no_exclude_tags(mock_logseq_class):
@@ -426,3 +516,19 @@ def test_query_no_filter_when_exclude_empty(mock_logseq_class):
         result = handler.run_tool({"query": "(page-property type x)"})
 
     assert "Private Page" in result[0].text
+
+
+@patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+@patch("mcp_logseq.tools.logseq.LogSeq")
+def test_query_drops_block_of_page_tagged_after_it_was_cached(mock_logseq_class):
+    client = _cached_page_client({}, {"tags": ["private"]})
+    client.query_dsl = Mock(return_value=[
+        {"content": "dear diary", "page": {"originalName": "Diary"}},
+    ])
+    mock_logseq_class.return_value = client
+
+    handler = QueryToolHandler()
+    with _exclude_tags_patch(["private"]):
+        result = handler.run_tool({"query": "(task TODO)"})
+
+    assert "dear diary" not in result[0].text
@@ -3,7 +3,7 @@ import pytest
 import responses
 import requests
 from unittest.mock import patch, Mock
-from mcp_logseq.logseq import LogSeq
+from mcp_logseq.logseq import LogSeq, LogSeqError, LogSeqHTTPError
 
 
 class TestLogSeqAPI:
@@ -47,11 +47,169 @@ class TestLogSeqAPI:
         url = logseq_client.get_base_url()
         assert url == "http://127.0.0.1:12315/api"
 
-    def test_get_headers(self, logseq_client):
-        """Test authentication headers generation."""
-        headers = logseq_client._get_headers()
+    def test_get_base_url_brackets_ipv6_host(self, mock_api_key):
+        client = LogSeq(api_key=mock_api_key, host="::1")
+        assert client.get_base_url() == "http://[::1]:12315/api"
+
+    def test_headers_built_once(self, logseq_client):
+        """Auth headers are precomputed and installed on the session."""
         expected = {"Authorization": f"Bearer {logseq_client.api_key}"}
-        assert headers == expected
+        assert logseq_client._headers == expected
+        assert (
+            logseq_client._session.headers["Authorization"]
+            == expected["Authorization"]
+        )
+
+    @responses.activate
+    def test_calls_share_pooled_session(self, logseq_client):
+        """Consecutive calls go through one Session carrying the auth header."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=[],
+            status=200,
+        )
+
+        with patch.object(
+            logseq_client._session, "post", wraps=logseq_client._session.post
+        ) as session_post:
+            logseq_client.list_pages()
+            logseq_client.list_pages()
+
+        assert session_post.call_count == 2
+        for call in responses.calls:
+            assert call.request.headers["Authorization"] == (
+                f"Bearer {logseq_client.api_key}"
+            )
+
+    @responses.activate
+    def test_requests_accept_compressed_responses(self, logseq_client):
+        """Large list/search payloads may come back gzip-compressed."""
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+
+        logseq_client.list_pages()
+
+        accept = responses.calls[0].request.headers["Accept-Encoding"]
+        assert "gzip" in accept
+
+    @responses.activate
+    def test_stdlib_json_fallback(self, logseq_client):
+        """Without orjson, responses decode through requests' own .json()."""
+        pages = [{"name": "café", "id": 1}]
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=pages, status=200
+        )
+
+        with patch("mcp_logseq.logseq.orjson", None):
+            assert logseq_client.list_pages() == pages
+
+    @responses.activate
+    def test_list_pages_cached_within_ttl(self, mock_api_key):
+        """With a TTL, repeat list_pages calls reuse one round-trip."""
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        assert client.list_pages() == []
+        assert client.list_pages() == []
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_list_pages_fresh_bypasses_cache(self, mock_api_key):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        client.list_pages()
+        client.list_pages(fresh=True)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_list_pages_cache_expires(self, mock_api_key):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        client.list_pages()
+        stored_at, value = client._cache[("list_pages",)]
+        client._cache[("list_pages",)] = (stored_at - 31, value)
+        client.list_pages()
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_write_invalidates_list_pages_cache(self, mock_api_key):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        client.list_pages()
+        client.delete_block("block-uuid")
+        client.list_pages()
+
+        # list, removeBlock, list again (the write dropped the cached list)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_get_page_content_cached_within_ttl(self, mock_api_key):
+        """A re-read page costs no round-trips; fresh=True always fetches."""
+        def reply(request):
+            method = json.loads(request.body)["method"]
+            body = {"name": "a"} if method == "logseq.Editor.getPage" else []
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.POST, "http://127.0.0.1:12315/api", callback=reply
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        first = client.get_page_content("A")
+        assert client.get_page_content("A") == first
+        assert len(responses.calls) == 2  # getPage + getPageBlocksTree
+
+        client.get_page_content("A", fresh=True)
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_read_cache_is_bounded_lru(self, mock_api_key):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+        client = LogSeq(api_key=mock_api_key, cache_ttl=30)
+
+        with patch("mcp_logseq.logseq._CACHE_MAX_ENTRIES", 2):
+            client.list_pages()
+            client.get_page_content("A")
+            client.list_pages()  # refresh recency: "A" is now the oldest
+            client.get_page_content("B")
+
+        assert list(client._cache) == [("list_pages",), ("page_content", "B")]
+
+    @responses.activate
+    def test_list_pages_uncached_by_default(self, logseq_client):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json=[], status=200
+        )
+
+        logseq_client.list_pages()
+        logseq_client.list_pages()
+
+        assert len(responses.calls) == 2
+
+    def test_context_manager_closes_session(self, mock_api_key):
+        """Leaving the with-block releases the pooled connections."""
+        client = LogSeq(api_key=mock_api_key)
+        with patch.object(client._session, "close") as close:
+            with client:
+                pass
+        close.assert_called_once()
 
     @responses.activate
     def test_create_page_success(self, logseq_client, mock_logseq_responses):
@@ -251,6 +409,34 @@ class TestLogSeqAPI:
         result = logseq_client.get_page_content("Non-existent Page")
         assert result is None
 
+    @responses.activate
+    def test_get_pages_content_preserves_order(self, logseq_client):
+        """Concurrent fetches come back in request order, None when missing."""
+
+        def reply(request):
+            body = json.loads(request.body)
+            method, name = body["method"], body["args"][0]
+            if name == "Missing":
+                return (200, {}, "null")
+            if method == "logseq.Editor.getPage":
+                return (200, {}, json.dumps({"originalName": name}))
+            return (200, {}, json.dumps([{"content": f"{name} body"}]))
+
+        responses.add_callback(
+            responses.POST, "http://127.0.0.1:12315/api", callback=reply
+        )
+
+        names = ["A", "Missing", "B", "C"]
+        results = logseq_client.get_pages_content(names)
+
+        assert [r and r["page"]["originalName"] for r in results] == [
+            "A", None, "B", "C"
+        ]
+        assert results[2]["blocks"] == [{"content": "B body"}]
+
+    def test_get_pages_content_empty(self, logseq_client):
+        assert logseq_client.get_pages_content([]) == []
+
     @responses.activate
     def test_delete_page_success(self, logseq_client, mock_logseq_responses):
         """Test successful page deletion."""
@@ -361,6 +547,118 @@ class TestLogSeqAPI:
         with pytest.raises(requests.exceptions.HTTPError):
             logseq_client.delete_block("block-uuid-missing")
 
+    @responses.activate
+    def test_http_error_is_typed(self, logseq_client):
+        """Error statuses raise LogSeqHTTPError carrying the status code."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json={"error": "boom"},
+            status=500,
+        )
+
+        with pytest.raises(LogSeqHTTPError) as exc_info:
+            logseq_client.list_pages()
+
+        err = exc_info.value
+        assert isinstance(err, LogSeqError)
+        assert err.status == 500
+        assert err.method == "logseq.Editor.getAllPages"
+        assert str(err) == (
+            "Logseq API returned HTTP 500 Internal Server Error "
+            "for logseq.Editor.getAllPages"
+        )
+
+    @responses.activate
+    def test_read_retried_on_transient_status(self, logseq_client):
+        """A 503 on a read is retried and the later success returned."""
+        url = "http://127.0.0.1:12315/api"
+        responses.add(responses.POST, url, json={"error": "busy"}, status=503)
+        responses.add(responses.POST, url, json=[{"name": "a"}], status=200)
+
+        with patch("mcp_logseq.logseq._RETRY_BACKOFF", 0):
+            assert logseq_client.list_pages() == [{"name": "a"}]
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_read_retries_are_bounded(self, logseq_client):
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json={}, status=503
+        )
+
+        with patch("mcp_logseq.logseq._RETRY_BACKOFF", 0):
+            with pytest.raises(LogSeqHTTPError):
+                logseq_client.list_pages()
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_write_not_retried_on_transient_status(self, logseq_client):
+        """Writes are never replayed: a retried write could apply twice."""
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", json={}, status=503
+        )
+
+        with pytest.raises(LogSeqHTTPError):
+            logseq_client.delete_block("block-uuid")
+
+        assert len(responses.calls) == 1
+
+    def test_read_retried_after_dropped_connection(self, logseq_client):
+        """A read on a keep-alive socket Logseq already closed is retried."""
+        ok = Mock(status_code=200, content=b'[{"name": "a"}]')
+        dropped = requests.ConnectionError(
+            "('Connection aborted.', RemoteDisconnected())"
+        )
+
+        with patch.object(
+            logseq_client._session, "post", side_effect=[dropped, ok]
+        ) as post, patch("mcp_logseq.logseq._RETRY_BACKOFF", 0):
+            assert logseq_client.list_pages() == [{"name": "a"}]
+
+        assert post.call_count == 2
+
+    def test_write_not_retried_after_dropped_connection(self, logseq_client):
+        """A dropped write may still have reached Logseq, so it is not replayed."""
+        with patch.object(
+            logseq_client._session, "post",
+            side_effect=requests.ConnectionError("Connection aborted."),
+        ) as post:
+            with pytest.raises(requests.ConnectionError):
+                logseq_client.delete_block("block-uuid")
+
+        assert post.call_count == 1
+
+    def test_bulk_methods_use_bulk_timeout(self, mock_api_key):
+        client = LogSeq(api_key=mock_api_key, timeout=(3, 6), bulk_timeout=(3, 30))
+
+        with patch.object(client._session, "post") as post:
+            post.return_value.status_code = 200
+            post.return_value.content = b"{}"
+            client.search_content("q")
+            client.get_block("uuid")
+
+        assert post.call_args_list[0].kwargs["timeout"] == (3, 30)
+        assert post.call_args_list[1].kwargs["timeout"] == (3, 6)
+
+    def test_bulk_timeout_defaults_to_timeout(self, mock_api_key):
+        client = LogSeq(api_key=mock_api_key, timeout=(2, 9))
+        assert client.bulk_timeout == (2, 9)
+
+    def test_adapter_pool_sized_for_concurrency(self, logseq_client):
+        """One host, a pool wide enough for concurrent calls, no overflow."""
+        adapter = logseq_client._session.get_adapter("http://x")
+        assert adapter._pool_connections == 1
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+    def test_adapter_retries_connection_failures_only(self, logseq_client):
+        retry = logseq_client._session.get_adapter("http://x").max_retries
+        assert retry.connect == 2
+        assert retry.read == 0
+        assert retry.status == 0
+
     @responses.activate
     def test_delete_block_network_error(self, logseq_client):
         """Test that a network/connection error propagates as an exception."""
@@ -374,6 +672,55 @@ class TestLogSeqAPI:
             logseq_client.delete_block("block-uuid-abc")
 
 
+    @responses.activate
+    def test_update_page_missing_page_checks_with_one_lookup(self, logseq_client):
+        """Existence is checked with getPage, not by listing every page."""
+        responses.add(
+            responses.POST, "http://127.0.0.1:12315/api", body="null", status=200
+        )
+
+        with pytest.raises(ValueError, match="Page 'Ghost' does not exist"):
+            logseq_client.update_page_with_blocks("Ghost", [{"content": "x"}])
+
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert body == {"method": "logseq.Editor.getPage", "args": ["Ghost"]}
+
+    @pytest.mark.parametrize("page_name", ["TEST PAGE", "test page"])
+    @responses.activate
+    def test_update_page_requires_exact_name_match(self, logseq_client, page_name):
+        """Only the display name matches; getPage's case-folded hits do not."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json={"name": "test page", "originalName": "Test Page"},
+            status=200,
+        )
+
+        with pytest.raises(ValueError, match="does not exist"):
+            logseq_client.update_page_with_blocks(page_name, [{"content": "x"}])
+
+    @responses.activate
+    def test_update_page_accepts_original_name(self, logseq_client):
+        """The page's originalName matches even though its name is lowercased."""
+        def reply(request):
+            method = json.loads(request.body)["method"]
+            if method == "logseq.Editor.getPage":
+                body = {"name": "test page", "originalName": "Test Page"}
+            else:
+                body = None
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.POST, "http://127.0.0.1:12315/api", callback=reply
+        )
+
+        result = logseq_client.update_page_with_blocks(
+            "Test Page", [{"content": "x"}]
+        )
+
+        assert result["page"] == "Test Page"
+
     @responses.activate
     def test_update_block_success(self, logseq_client):
         """Test successful block update calls updateBlock with UUID and content."""
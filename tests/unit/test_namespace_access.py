@@ -856,7 +856,7 @@ def test_query_filters_block_from_tag_excluded_page():
         {"content": "public note", "page": {"originalName": "notes"}},
     ]
 
-    def _content(page_name):
+    def _content(page_name, fresh=False):
         if page_name == "vault":
             return {"page": {"properties": {"tags": ["keys"]}}}
         return {"page": {"properties": {}}}
@@ -701,6 +701,28 @@ This is a new paragraph.
         assert "This is a paragraph that continues" in blocks[0].content
         assert "This is a new paragraph" in blocks[1].content
 
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "## Heading",
+            "- bullet",
+            "1. numbered",
+            "- [ ] task",
+            "> quote",
+            "***",
+            "```python",
+            "$$",
+            "type:: video",
+            "| a | b |",
+        ],
+    )
+    def test_paragraph_ends_at_special_element(self, line):
+        """A line that starts another element ends the paragraph before it."""
+        blocks = parse_markdown_to_blocks(f"Some text\n{line}\n")
+
+        assert blocks[0].content == "Some text"
+        assert line not in blocks[0].content
+
     def test_inline_formatting_preserved(self):
         """Test that inline markdown is preserved."""
         content = "**bold** and *italic* and `code` and [link](url)"
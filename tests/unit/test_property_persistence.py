@@ -104,10 +104,9 @@ class TestUpdatePageProperties:
     def test_db_mode_append_merges_via_set_page_properties(self, logseq_client_db):
         """DB graphs: append merges with existing page-level props via setPageProperties."""
         url = "http://127.0.0.1:12315/api"
-        responses.add(responses.POST, url, json=[{"name": "Test Page", "originalName": "Test Page"}], status=200)  # list_pages
+        responses.add(responses.POST, url, json={"name": "Test Page", "originalName": "Test Page", "properties": {"priority": "low", "status": "old"}}, status=200)  # getPage existence check (also carries page props)
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Existing"}], status=200)  # get last block
         responses.add(responses.POST, url, json=[{"uuid": "block-2"}], status=200)  # insertBatchBlock
-        responses.add(responses.POST, url, json={"name": "Test Page", "properties": {"priority": "low", "status": "old"}}, status=200)  # getPage
         responses.add(responses.POST, url, json=True, status=200)  # setPageProperties
 
         result = logseq_client_db.update_page_with_blocks(
@@ -128,12 +127,14 @@ class TestUpdatePageProperties:
         # The full merged set is written page-level
         assert body["args"][1]["status"] == "old"
         assert self._calls_for("upsertBlockProperty") == []
+        # Existing props come from the existence check; no second getPage
+        assert len(self._calls_for('getPage"')) == 1
 
     @responses.activate
     def test_db_mode_replace_uses_set_page_properties(self, logseq_client_db):
         """DB graphs: replace writes only the new props via setPageProperties."""
         url = "http://127.0.0.1:12315/api"
-        responses.add(responses.POST, url, json=[{"name": "Test Page", "originalName": "Test Page"}], status=200)  # list_pages
+        responses.add(responses.POST, url, json={"name": "Test Page", "originalName": "Test Page"}, status=200)  # getPage existence check
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Old", "properties": {"status": "old"}}], status=200)  # clear: get blocks
         responses.add(responses.POST, url, json=True, status=200)  # removeBlock
         responses.add(responses.POST, url, json={"uuid": "block-2", "content": "New"}, status=200)  # appendBlockInPage
@@ -160,10 +161,9 @@ class TestUpdatePageProperties:
         append its merge semantics on file graphs.
         """
         url = "http://127.0.0.1:12315/api"
-        responses.add(responses.POST, url, json=[{"name": "Test Page", "originalName": "Test Page"}], status=200)  # list_pages
+        responses.add(responses.POST, url, json={"name": "Test Page", "originalName": "Test Page", "properties": {"priority": "low", "status": "old"}}, status=200)  # getPage existence check (also carries page props)
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Existing", "properties": {"priority": "low", "status": "old"}}], status=200)  # get last block
         responses.add(responses.POST, url, json=[{"uuid": "block-2"}], status=200)  # insertBatchBlock
-        responses.add(responses.POST, url, json={"name": "Test Page", "properties": {"priority": "low", "status": "old"}}, status=200)  # getPage (merge bookkeeping)
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Existing", "properties": {"priority": "low", "status": "old"}}], status=200)  # _update_page_properties: get first block
         responses.add(responses.POST, url, json=True, status=200)  # upsertBlockProperty (repeats)
 
@@ -196,7 +196,7 @@ class TestUpdatePageProperties:
     def test_file_mode_replace_removes_stale_keys(self, logseq_client):
         """File graphs: replace removes first-block props absent from the new set."""
         url = "http://127.0.0.1:12315/api"
-        responses.add(responses.POST, url, json=[{"name": "Test Page", "originalName": "Test Page"}], status=200)  # list_pages
+        responses.add(responses.POST, url, json={"name": "Test Page", "originalName": "Test Page"}, status=200)  # getPage existence check
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Old", "properties": {"priority": "low", "status": "old"}}], status=200)  # clear: get blocks
         responses.add(responses.POST, url, json=True, status=200)  # removeBlock (clear content)
         responses.add(responses.POST, url, json={"uuid": "block-2", "content": "New"}, status=200)  # appendBlockInPage anchor
@@ -233,7 +233,7 @@ class TestUpdatePageProperties:
         properties. An empty anchor block must be created so the properties land.
         """
         url = "http://127.0.0.1:12315/api"
-        responses.add(responses.POST, url, json=[{"name": "Test Page", "originalName": "Test Page"}], status=200)  # list_pages
+        responses.add(responses.POST, url, json={"name": "Test Page", "originalName": "Test Page"}, status=200)  # getPage existence check
         responses.add(responses.POST, url, json=[{"uuid": "block-1", "content": "Old", "properties": {"status": "old"}}], status=200)  # clear: get blocks
         responses.add(responses.POST, url, json=True, status=200)  # removeBlock
         responses.add(responses.POST, url, json=[], status=200)  # _resolve_first_block: page now empty
@@ -262,11 +262,11 @@ class TestUpdatePageProperties:
     @responses.activate
     def test_update_page_with_empty_properties_dict(self, logseq_client):
         """Test that empty properties dict doesn't cause errors."""
-        # Mock list_pages for validation
+        # Mock getPage for the existence check
         responses.add(
             responses.POST,
             "http://127.0.0.1:12315/api",
-            json=[{"name": "Test Page", "originalName": "Test Page"}],
+            json={"name": "Test Page", "originalName": "Test Page"},
             status=200,
         )
 
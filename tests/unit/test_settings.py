@@ -19,7 +19,9 @@ _ENV_VARS = (
     "LOGSEQ_VERIFY_SSL",
     "LOGSEQ_API_CONNECT_TIMEOUT",
     "LOGSEQ_API_READ_TIMEOUT",
+    "LOGSEQ_API_BULK_READ_TIMEOUT",
     "LOGSEQ_DB_MODE",
+    "LOGSEQ_API_CACHE_TTL",
 )
 
 
@@ -60,7 +62,9 @@ class TestLoadSettings:
         assert s.port == 12315
         assert s.verify_ssl is False  # plain http → no TLS verification
         assert s.timeout == (3, 6)
+        assert s.bulk_timeout == (3, 20)
         assert s.db_mode is False
+        assert s.cache_ttl == 30
 
     def test_api_url_parsed(self, clean_env):
         clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
@@ -93,6 +97,31 @@ class TestLoadSettings:
         clean_env.setenv("LOGSEQ_API_READ_TIMEOUT", "not-a-number")
         assert settings.load_settings().timeout == (3, 6)
 
+    def test_bulk_read_timeout_override(self, clean_env):
+        clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
+        clean_env.setenv("LOGSEQ_API_BULK_READ_TIMEOUT", "45")
+        assert settings.load_settings().bulk_timeout == (3, 45.0)
+
+    def test_bulk_read_timeout_never_below_read_timeout(self, clean_env):
+        clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
+        clean_env.setenv("LOGSEQ_API_READ_TIMEOUT", "60")
+        assert settings.load_settings().bulk_timeout == (3, 60.0)
+
+    def test_explicit_bulk_read_timeout_clamped_to_read_timeout(self, clean_env):
+        clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
+        clean_env.setenv("LOGSEQ_API_BULK_READ_TIMEOUT", "2")
+        assert settings.load_settings().bulk_timeout == (3, 6)
+
+    def test_cache_ttl_zero_disables(self, clean_env):
+        clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
+        clean_env.setenv("LOGSEQ_API_CACHE_TTL", "0")
+        assert settings.load_settings().cache_ttl == 0
+
+    def test_invalid_cache_ttl_falls_back_to_default(self, clean_env):
+        clean_env.setenv("LOGSEQ_API_TOKEN", "tok")
+        clean_env.setenv("LOGSEQ_API_CACHE_TTL", "-5")
+        assert settings.load_settings().cache_ttl == 30
+
 
 class TestGetSettingsCache:
     def test_cached_across_env_changes(self, clean_env):
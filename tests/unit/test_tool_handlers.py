@@ -1,4 +1,5 @@
 import json
+import sys
 
 import pytest
 from unittest.mock import patch, Mock
@@ -9,11 +10,13 @@ from mcp_logseq.tools import (
     CreatePageToolHandler,
     ListPagesToolHandler,
     GetPageContentToolHandler,
+    GetPagesContentToolHandler,
     DeletePageToolHandler,
     DeleteBlockToolHandler,
     UpdateBlockToolHandler,
     GetBlockToolHandler,
     UpdatePageToolHandler,
+    BulkPagesToolHandler,
     SearchToolHandler,
     QueryToolHandler,
     FindPagesByPropertyToolHandler,
@@ -46,6 +49,77 @@ class TestToolConfiguration:
 
         assert mock_logseq_class.call_args.kwargs["timeout"] == (2.5, 15.0)
 
+    def test_make_api_reuses_client_across_calls(self):
+        assert tools._make_api() is tools._make_api()
+
+    def test_make_api_rebuilds_client_when_settings_change(self, monkeypatch):
+        from mcp_logseq import settings
+
+        first = tools._make_api()
+        monkeypatch.setenv("LOGSEQ_API_READ_TIMEOUT", "30")
+        settings.get_settings.cache_clear()
+
+        second = tools._make_api()
+        assert second is not first
+        assert second.timeout == (3, 30.0)
+
+
+class TestRequiredArgs:
+    """Required arguments are checked centrally from each inputSchema."""
+
+    @patch("mcp_logseq.tools._make_api")
+    def test_missing_arg_rejected_before_api_is_built(self, mock_make_api):
+        with pytest.raises(RuntimeError, match="block_uuid argument required"):
+            DeleteBlockToolHandler().run_tool({})
+
+        mock_make_api.assert_not_called()
+
+    def test_required_args_read_from_schema(self):
+        for handler_cls in (CreatePageToolHandler, RenamePageToolHandler):
+            handler = handler_cls()
+            schema = handler.get_tool_description().inputSchema
+            assert handler._required_args == tuple(schema["required"])
+
+
+class TestDumpJson:
+    """JSON-format tool output is identical with and without orjson."""
+
+    PAYLOAD = {"page": "Café", "blocks": [{"id": 1, "children": []}], "n": 1.5}
+
+    def test_stdlib_fallback(self):
+        with patch("mcp_logseq.tools.base.orjson", None):
+            text = tools.base._dump_json(self.PAYLOAD)
+
+        assert text == json.dumps(self.PAYLOAD, indent=2, ensure_ascii=False)
+
+    def test_orjson_matches_stdlib(self):
+        pytest.importorskip("orjson")
+
+        assert tools.base._dump_json(self.PAYLOAD) == json.dumps(
+            self.PAYLOAD, indent=2, ensure_ascii=False
+        )
+
+    def test_deep_nesting_beyond_orjson_limit(self):
+        """Trees deeper than orjson allows still serialize, via the stdlib."""
+        pytest.importorskip("orjson")
+        block = {"content": "leaf", "children": []}
+        for _ in range(200):
+            block = {"content": "node", "children": [block]}
+
+        assert tools.base._dump_json(block) == json.dumps(
+            block, indent=2, ensure_ascii=False
+        )
+
+
+class TestTruncate:
+    """Long result text is cut at the limit and marked with an ellipsis."""
+
+    def test_short_text_unchanged(self):
+        assert tools.base._truncate("a" * 150, 150) == "a" * 150
+
+    def test_long_text_cut(self):
+        assert tools.base._truncate("a" * 151, 150) == "a" * 150 + "..."
+
 
 class TestCreatePageToolHandler:
     """Test cases for the new CreatePageToolHandler with block parsing."""
@@ -262,6 +336,22 @@ class TestListPagesToolHandler:
         assert "Total pages: 2" in text
         assert "(including journal pages)" in text
 
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_sorts_by_name_case_insensitively(self, mock_logseq_class):
+        mock_api = Mock()
+        mock_api.list_pages.return_value = [
+            {"originalName": "banana", "journal?": False},
+            {"originalName": "Cherry", "journal?": False},
+            {"originalName": "Apple", "journal?": False},
+        ]
+        mock_logseq_class.return_value = mock_api
+
+        handler = ListPagesToolHandler()
+        result = handler.run_tool({})
+
+        assert "- Apple\n- banana\n- Cherry\n" in result[0].text
+
 
 class TestGetPageContentToolHandler:
     """Test cases for GetPageContentToolHandler."""
@@ -520,6 +610,83 @@ class TestGetPageContentToolHandler:
         assert second_child.startswith("  - Second child")
         assert third_child.startswith("  - Third child")
 
+    def test_format_block_tree_beyond_recursion_limit(self):
+        """Nesting deeper than the recursion limit is formatted in pre-order."""
+        depth = sys.getrecursionlimit() + 100
+        root = node = {"content": "level 0", "children": []}
+        for level in range(1, depth):
+            child = {"content": f"level {level}", "children": []}
+            node["children"] = [child, {"content": f"sibling {level}"}]
+            node = child
+
+        lines = GetPageContentToolHandler._format_block_tree(root)
+
+        assert len(lines) == 2 * depth - 1
+        assert lines[:3] == ["- level 0", "  - level 1", "    - level 2"]
+        assert lines[-1] == "  - sibling 1"
+
+
+class TestGetPagesContentToolHandler:
+    """Test cases for GetPagesContentToolHandler."""
+
+    def test_get_tool_description(self):
+        tool = GetPagesContentToolHandler().get_tool_description()
+
+        assert tool.name == "get_pages_content"
+        assert tool.inputSchema["required"] == ["page_names"]
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_text_format(self, mock_logseq_class):
+        """Each page gets its own section, in request order."""
+        mock_api = Mock()
+        mock_api.get_pages_content.return_value = [
+            {"page": {"originalName": "A"}, "blocks": [{"content": "Alpha"}]},
+            None,
+        ]
+        mock_logseq_class.return_value = mock_api
+
+        handler = GetPagesContentToolHandler()
+        result = handler.run_tool({"page_names": ["A", "Missing"]})
+
+        mock_api.get_pages_content.assert_called_once_with(
+            ["A", "Missing"], fresh=False
+        )
+        assert result[0].text == "# A\n\n- Alpha\n\n# Missing\n\nPage 'Missing' not found."
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_json_format(self, mock_logseq_class):
+        page = {"page": {"name": "a"}, "blocks": []}
+        mock_api = Mock()
+        mock_api.get_pages_content.return_value = [page, None]
+        mock_logseq_class.return_value = mock_api
+
+        handler = GetPagesContentToolHandler()
+        result = handler.run_tool({"page_names": ["A", "B"], "format": "json"})
+
+        assert json.loads(result[0].text) == {"A": page, "B": None}
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_denies_tag_excluded_page(self, mock_logseq_class):
+        """One restricted page fails the whole batch instead of being rendered."""
+        mock_api = Mock()
+        mock_api.get_pages_content.return_value = [
+            {"page": {"originalName": "Public"}, "blocks": []},
+            {"page": {"originalName": "Secret", "properties": {"tags": ["private"]}}, "blocks": []},
+        ]
+        mock_logseq_class.return_value = mock_api
+
+        handler = GetPagesContentToolHandler()
+        with patch("mcp_logseq.access.get_access_config", return_value=AccessConfig(exclude_tags=["private"])):
+            with pytest.raises(RuntimeError, match="Access denied: page 'Secret'"):
+                handler.run_tool({"page_names": ["Public", "Secret"]})
+
+    def test_run_tool_missing_page_names(self):
+        with pytest.raises(RuntimeError, match="page_names argument required"):
+            GetPagesContentToolHandler().run_tool({})
+
 
 class TestDeletePageToolHandler:
     """Test cases for DeletePageToolHandler."""
@@ -802,13 +969,16 @@ class TestUpdatePageToolHandler:
         mock_logseq_class.return_value = mock_api
 
         handler = UpdatePageToolHandler()
-        result = handler.run_tool(
-            {"page_name": "Test Page", "properties": {"priority": "high"}}
-        )
+        with patch("mcp_logseq.tools.pages.parser.parse_content") as mock_parse:
+            result = handler.run_tool(
+                {"page_name": "Test Page", "properties": {"priority": "high"}}
+            )
 
-        # Verify properties were passed
+        # Verify properties were passed, with no blocks and nothing parsed
         call_args = mock_api.update_page_with_blocks.call_args
+        assert call_args[0][1] == []
         assert call_args[0][2] == {"priority": "high"}
+        mock_parse.assert_not_called()
 
     @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
     def test_run_tool_no_updates(self):
@@ -837,6 +1007,135 @@ class TestUpdatePageToolHandler:
         assert "Error: Page 'Test' does not exist" in text
 
 
+class TestBulkPagesToolHandler:
+    """Test cases for BulkPagesToolHandler."""
+
+    def test_get_tool_description(self):
+        tool = BulkPagesToolHandler().get_tool_description()
+
+        assert tool.name == "bulk_pages"
+        assert tool.inputSchema["required"] == ["operations"]
+        item = tool.inputSchema["properties"]["operations"]["items"]
+        assert item["properties"]["op"]["enum"] == ["create", "update", "delete"]
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_applies_operations_in_order(self, mock_logseq_class):
+        """Every operation runs; a failure is reported without stopping the rest."""
+        mock_api = Mock()
+        mock_api.page_exists.return_value = False
+        mock_api.update_page_with_blocks.side_effect = ValueError(
+            "Page 'Missing' does not exist"
+        )
+        mock_api.delete_page.return_value = {"success": True}
+        mock_logseq_class.return_value = mock_api
+
+        handler = BulkPagesToolHandler()
+        result = handler.run_tool({
+            "operations": [
+                {"op": "create", "page_name": "New", "content": "- hello"},
+                {"op": "update", "page_name": "Missing", "content": "x"},
+                {"op": "delete", "page_name": "Old"},
+            ]
+        })
+
+        text = result[0].text
+        assert text.startswith("Bulk page operations: 2 succeeded, 1 failed")
+        assert "1. ✅ create 'New'" in text
+        assert "2. ❌ update 'Missing': Page 'Missing' does not exist" in text
+        assert "3. ✅ delete 'Old'" in text
+        mock_api.create_page_with_blocks.assert_called_once()
+        assert mock_api.create_page_with_blocks.call_args[0][0] == "New"
+        mock_api.delete_page.assert_called_once_with("Old")
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_json_format(self, mock_logseq_class):
+        mock_api = Mock()
+        mock_logseq_class.return_value = mock_api
+
+        handler = BulkPagesToolHandler()
+        result = handler.run_tool({
+            "operations": [{"op": "rename", "page_name": "A"}],
+            "format": "json",
+        })
+
+        data = json.loads(result[0].text)
+        assert data["succeeded"] == 0
+        assert data["failed"] == 1
+        assert data["results"] == [{
+            "op": "rename", "page_name": "A",
+            "error": "Unknown operation 'rename'", "ok": False,
+        }]
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_malformed_items_do_not_stop_batch(self, mock_logseq_class):
+        """Non-object items fail on their own; valid operations around them run."""
+        mock_api = Mock()
+        mock_api.delete_page.return_value = {"success": True}
+        mock_logseq_class.return_value = mock_api
+
+        handler = BulkPagesToolHandler()
+        result = handler.run_tool({
+            "operations": [
+                {"op": "delete", "page_name": "A"},
+                "delete B",
+                None,
+                {"op": "delete", "page_name": "C"},
+            ],
+            "format": "json",
+        })
+
+        data = json.loads(result[0].text)
+        assert data["succeeded"] == 2
+        assert data["failed"] == 2
+        assert [r["ok"] for r in data["results"]] == [True, False, False, True]
+        assert data["results"][1] == {
+            "op": None, "page_name": None,
+            "error": "Operation must be an object", "ok": False,
+        }
+        assert mock_api.delete_page.call_count == 2
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_rejects_non_list_operations(self, mock_logseq_class):
+        mock_api = Mock()
+        mock_logseq_class.return_value = mock_api
+
+        handler = BulkPagesToolHandler()
+        with pytest.raises(RuntimeError, match="operations must be a list"):
+            handler.run_tool({"operations": {"op": "delete", "page_name": "A"}})
+
+        mock_api.delete_page.assert_not_called()
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_enforces_each_operation_policy(self, mock_logseq_class):
+        """A restricted page fails its own operation and is never written."""
+        mock_api = Mock()
+        mock_api.page_exists.return_value = False
+        mock_logseq_class.return_value = mock_api
+
+        handler = BulkPagesToolHandler()
+        config = AccessConfig(exclude_namespaces=["secret"])
+        with patch("mcp_logseq.access.get_access_config", return_value=config):
+            result = handler.run_tool({
+                "operations": [
+                    {"op": "create", "page_name": "secret/plan", "content": "x"},
+                    {"op": "delete", "page_name": "secret/old"},
+                    {"op": "create", "page_name": "public", "content": "x"},
+                ]
+            })
+
+        text = result[0].text
+        assert "1 succeeded, 2 failed" in text
+        assert "Access denied: page 'secret/plan'" in text
+        mock_api.delete_page.assert_not_called()
+        mock_api.create_page_with_blocks.assert_called_once()
+        assert mock_api.create_page_with_blocks.call_args[0][0] == "public"
+
+
 class TestSearchToolHandler:
     """Test cases for SearchToolHandler."""
 
@@ -918,6 +1217,85 @@ class TestSearchToolHandler:
         # Verify API was called with correct options
         mock_api.search_content.assert_called_once_with("test", {"limit": 5})
 
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_header_reports_limit_cut(self, mock_logseq_class):
+        """A section cut short by limit says how many results it lists."""
+        mock_api = Mock()
+        mock_api.search_content.return_value = {
+            "blocks": [{"block/content": f"Block {i}"} for i in range(5)],
+            "pages": [],
+            "files": [],
+        }
+        mock_logseq_class.return_value = mock_api
+
+        handler = SearchToolHandler()
+        result = handler.run_tool({"query": "test", "limit": 2})
+
+        text = result[0].text
+        assert "Content Blocks (5 found, showing 2)" in text
+        assert "2. Block 1" in text
+        assert "Block 2" not in text
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_null_categories(self, mock_logseq_class):
+        """Categories Logseq returns as null count as empty."""
+        mock_api = Mock()
+        mock_api.search_content.return_value = {
+            "blocks": None,
+            "pages": ["Only Page"],
+            "pages-content": None,
+            "files": None,
+        }
+        mock_logseq_class.return_value = mock_api
+
+        handler = SearchToolHandler()
+        result = handler.run_tool({"query": "test"})
+
+        text = result[0].text
+        assert "Only Page" in text
+        assert "Total results found: 1" in text
+
+    @pytest.mark.parametrize("db_mode", [False, True])
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_null_categories_json_format(self, mock_logseq_class, db_mode):
+        """format=json treats null categories as empty in both graph modes."""
+        mock_api = Mock()
+        mock_api.search_content.return_value = {
+            "blocks": None,
+            "pages": None,
+            "pages-content": None,
+            "files": None,
+        }
+        mock_logseq_class.return_value = mock_api
+
+        handler = SearchToolHandler()
+        with patch("mcp_logseq.tools._get_db_mode", return_value=db_mode):
+            result = handler.run_tool(
+                {"query": "test", "format": "json", "include_files": True}
+            )
+
+        data = json.loads(result[0].text)
+        assert data["blocks"] == []
+        assert data["pages"] == []
+        assert data["files"] == []
+
+    @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
+    @patch("mcp_logseq.tools.logseq.LogSeq")
+    def test_run_tool_null_categories_db_mode(self, mock_logseq_class):
+        """DB-mode text output treats null categories as empty."""
+        mock_api = Mock()
+        mock_api.search_content.return_value = {"blocks": None, "files": None}
+        mock_logseq_class.return_value = mock_api
+
+        handler = SearchToolHandler()
+        with patch("mcp_logseq.tools._get_db_mode", return_value=True):
+            result = handler.run_tool({"query": "test", "include_files": True})
+
+        assert "Total results found: 0" in result[0].text
+
     @patch.dict("os.environ", {"LOGSEQ_API_TOKEN": "test_token"})
     @patch("mcp_logseq.tools.logseq.LogSeq")
     def test_run_tool_db_mode(self, mock_logseq_class):
@@ -1306,6 +1684,19 @@ class TestFindPagesByPropertyToolHandler:
 
         mock_api.query_dsl.assert_called_once_with('(page-property status "in \\"progress\\"")')
 
+    @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    def test_run_tool_escapes_backslashes(self, mock_logseq_class):
+        """A trailing backslash cannot escape the closing quote."""
+        mock_api = Mock()
+        mock_api.query_dsl.return_value = []
+        mock_logseq_class.return_value = mock_api
+
+        handler = FindPagesByPropertyToolHandler()
+        handler.run_tool({"property_name": "path", "property_value": "C:\\"})
+
+        mock_api.query_dsl.assert_called_once_with('(page-property path "C:\\\\")')
+
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     def test_run_tool_missing_args(self):
         """Test missing required argument."""
@@ -1389,6 +1780,26 @@ class TestGetPagesTreeFromNamespaceToolHandler:
         assert "tree" in tool.description.lower()
         assert "namespace" in tool.inputSchema["properties"]
         assert "namespace" in tool.inputSchema["required"]
+        assert tool.inputSchema["properties"]["format"]["enum"] == ["text", "json"]
+
+    @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    def test_run_tool_json_format(self, mock_logseq_class):
+        """format=json returns the tree as JSON instead of rendered text."""
+        tree = [
+            {
+                "originalName": "Projects/2024",
+                "children": [{"originalName": "Projects/2024/ClientA", "children": []}],
+            }
+        ]
+        mock_api = Mock()
+        mock_api.get_pages_tree_from_namespace.return_value = tree
+        mock_logseq_class.return_value = mock_api
+
+        handler = GetPagesTreeFromNamespaceToolHandler()
+        result = handler.run_tool({"namespace": "Projects", "format": "json"})
+
+        assert json.loads(result[0].text) == tree
 
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
@@ -1426,6 +1837,30 @@ class TestGetPagesTreeFromNamespaceToolHandler:
         assert "Projects/2024/ClientB" in text
         assert "Projects/Archive" in text
 
+    @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    def test_run_tool_depth_first_order(self, mock_logseq_class):
+        """Each page is followed by its whole subtree before its next sibling."""
+        mock_api = Mock()
+        mock_api.get_pages_tree_from_namespace.return_value = [
+            {
+                "originalName": "P/A",
+                "children": [
+                    {"originalName": "P/A/1", "children": [
+                        {"originalName": "P/A/1/x", "children": []},
+                    ]},
+                    {"originalName": "P/A/2", "children": []},
+                ],
+            },
+            {"originalName": "P/B", "children": []},
+        ]
+        mock_logseq_class.return_value = mock_api
+
+        result = GetPagesTreeFromNamespaceToolHandler().run_tool({"namespace": "P"})
+
+        lines = result[0].text.split("\n\n", 1)[1].split("\n")
+        assert lines == ["P/A", "P/A/1", "P/A/1/x", "P/A/2", "P/B"]
+
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
     def test_run_tool_empty_namespace(self, mock_logseq_class):